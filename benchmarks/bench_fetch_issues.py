@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Load-test the fetch -> dedupe -> prioritize -> score pipeline against the fake GitHub API.
+
+Reports p50/p95/p99 latency and requests/sec per concurrency level, e.g.
+    python benchmarks/bench_fetch_issues.py --concurrency 1,4,16 --requests 40
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_github_server import FakeGitHub, load_fixtures, start_server
+from services.ai_service import AIService
+from services.analysis_cache import AnalysisCache
+from services.github_service import GitHubService
+from services.http_cache import HTTPCache
+from services.issue_store import IssueStore
+from services.rate_limiter import RateLimiter
+from services.repo_metadata import RepoMetadataStore
+from services.result_cache import ResultCache
+from services.token_pool import TokenPool
+
+PROFILES = [
+    {'experience_level': 'beginner', 'skills': ['Python', 'HTML'], 'interests': ['web', 'documentation']},
+    {'experience_level': 'intermediate', 'skills': ['JavaScript', 'React'], 'interests': ['frontend', 'testing']},
+    {'experience_level': 'advanced', 'skills': ['Go', 'Rust'], 'interests': ['performance', 'backend']},
+]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Pipeline:
+    """One app process: shared caches unless running cold"""
+
+    def __init__(self, base_url: str, tokens: List[str], backend: str, cold: bool, use_ai: bool, max_issues: int):
+        self.base_url = base_url
+        self.tokens = tokens
+        self.backend = backend
+        self.cold = cold
+        self.use_ai = use_ai
+        self.max_issues = max_issues
+        self.rate_limiter = RateLimiter()
+        self.shared = self._caches()
+        self.analysis_cache = AnalysisCache(ResultCache())
+
+    def _caches(self) -> Dict:
+        return {
+            'http_cache': HTTPCache(),
+            'issue_cache': ResultCache(),
+            'repo_metadata': RepoMetadataStore(cache=ResultCache()),
+            'issue_store': IssueStore(cache=ResultCache())
+        }
+
+    def run(self, n: int) -> float:
+        profile = PROFILES[n % len(PROFILES)]
+        caches = self._caches() if self.cold else self.shared
+        service = GitHubService(base_url=self.base_url, rate_limiter=self.rate_limiter, backend=self.backend,
+                                token_pool=TokenPool(self.tokens, self.rate_limiter), **caches)
+
+        start = time.perf_counter()
+        issues = service.fetch_issues(profile['skills'], profile['interests'],
+                                      profile['experience_level'], max_results=self.max_issues)
+        ai_service = AIService(analysis_cache=AnalysisCache(ResultCache()) if self.cold else self.analysis_cache)
+        if self.use_ai:
+            ai_service.get_recommendations(issues, profile)
+        else:
+            ai_service._fallback_scoring(issues, profile)
+        return time.perf_counter() - start
+
+
+def run_level(pipeline: Pipeline, concurrency: int, requests: int) -> Dict:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(pipeline.run, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'concurrency': concurrency,
+        'requests': requests,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'mean': statistics.mean(latencies),
+        'rps': requests / elapsed if elapsed else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GitHubService.fetch_issues under load")
+    parser.add_argument('--concurrency', default='1,4,16', help="Comma-separated concurrency levels")
+    parser.add_argument('--requests', type=int, default=30, help="Pipeline runs per concurrency level")
+    parser.add_argument('--max-issues', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.08, help="Fake API latency in seconds")
+    parser.add_argument('--search-limit', type=int, default=100000, help="Fake search quota per window")
+    parser.add_argument('--error-403', type=float, default=0.0)
+    parser.add_argument('--error-422', type=float, default=0.0)
+    parser.add_argument('--backend', choices=['rest', 'graphql'], default='rest')
+    parser.add_argument('--tokens', type=int, default=0, help="Size of the token pool (GraphQL needs at least 1)")
+    parser.add_argument('--cold', action='store_true', help="Fresh caches for every run (no cross-user reuse)")
+    parser.add_argument('--ai', action='store_true', help="Score with Ollama instead of fallback scoring")
+    args = parser.parse_args()
+
+    api = FakeGitHub(load_fixtures(), latency=args.latency, search_limit=args.search_limit,
+                     error_403=args.error_403, error_422=args.error_422)
+    server = start_server(api)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    # GraphQL needs a token; the REST backend runs anonymously unless given a pool
+    token_count = max(args.tokens, 1) if args.backend == 'graphql' else args.tokens
+    tokens = [f'bench-token-{n}' for n in range(token_count)]
+
+    print(f"📊 fetch_issues benchmark ({args.backend}, {len(tokens)} tokens, {'cold' if args.cold else 'shared'} caches, "
+          f"{args.latency * 1000:.0f}ms API latency)")
+    print(f"{'conc':>5} {'reqs':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'mean ms':>9} {'req/s':>8}")
+
+    for level in [int(c) for c in args.concurrency.split(',') if c.strip()]:
+        pipeline = Pipeline(base_url, tokens, args.backend, args.cold, args.ai, args.max_issues)
+        result = run_level(pipeline, level, args.requests)
+        print(f"{result['concurrency']:>5} {result['requests']:>5} {result['p50'] * 1000:>9.1f} "
+              f"{result['p95'] * 1000:>9.1f} {result['p99'] * 1000:>9.1f} "
+              f"{result['mean'] * 1000:>9.1f} {result['rps']:>8.2f}")
+
+    print(f"Upstream requests served: {api.requests}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GitHub REST and GraphQL APIs used by GitHubService.
+
+Replays fixture issues with configurable latency, per-token rate limits and
+injected 403/422 errors. Point the app or the benchmarks at it with
+GITHUB_API_URL=http://127.0.0.1:<port>.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'github_issues.json')
+
+_LABEL_QUALIFIER = re.compile(r'label:"([^"]+)"|label:(\S+)')
+_LANGUAGE_QUALIFIER = re.compile(r'language:(\S+)')
+_STATE_QUALIFIER = re.compile(r'state:(open|closed)')
+_UPDATED_QUALIFIER = re.compile(r'updated:(>=|>)(\S+)')
+
+
+def generate_fixtures(issue_count: int = 240, repo_count: int = 40, seed: int = 2025) -> Dict:
+    """Deterministic synthetic issues shaped like GitHub search API items"""
+
+    rng = random.Random(seed)
+    languages = ['Python', 'JavaScript', 'TypeScript', 'Java', 'Go', 'Rust', 'C++', 'Ruby', 'PHP', 'HTML']
+    topics = ['web-development', 'machine-learning', 'python', 'javascript', 'react',
+              'open-source', 'beginner-friendly', 'documentation']
+    label_pool = ['hacktoberfest', 'hacktoberfest2025', 'hacktoberfest-accepted', 'good first issue',
+                  'help wanted', 'beginner-friendly', 'first-timers-only', 'enhancement', 'feature',
+                  'bug', 'documentation', 'easy', 'performance', 'refactor', 'python', 'javascript',
+                  'frontend', 'backend', 'css', 'testing']
+    verbs = ['Add', 'Fix', 'Improve', 'Document', 'Refactor', 'Test', 'Update', 'Remove']
+    nouns = ['dark mode toggle', 'login form validation', 'README setup steps', 'API pagination',
+             'CLI help output', 'unit tests for parser', 'CI workflow', 'accessibility labels',
+             'search endpoint', 'error messages', 'Docker image', 'translation strings']
+
+    repositories = {}
+    for n in range(repo_count):
+        owner = f"org{n % 12}"
+        name = rng.choice(['hacktoberfest', 'awesome', 'tiny', 'open', 'community']) + f"-project-{n}"
+        repositories[f"{owner}/{name}"] = {
+            'stars': int(rng.paretovariate(1.2) * 40),
+            'language': rng.choice(languages),
+            'topics': rng.sample(topics, 3),
+            'archived': False
+        }
+
+    names = list(repositories)
+    items = []
+    for n in range(issue_count):
+        full_name = rng.choice(names)
+        labels = ['hacktoberfest'] + rng.sample(label_pool[1:], rng.randint(1, 4))
+        day = rng.randint(1, 30)
+        items.append({
+            'id': 900000 + n,
+            'number': rng.randint(1, 3000),
+            'title': f"{rng.choice(verbs)} {rng.choice(nouns)}",
+            'body': ' '.join(rng.choice(nouns) for _ in range(rng.randint(5, 40))),
+            'html_url': f"https://github.com/{full_name}/issues/{n + 1}",
+            'repository_url': f"https://api.github.com/repos/{full_name}",
+            'labels': [{'name': label} for label in labels],
+            'comments': rng.randint(0, 12),
+            'created_at': f"2025-09-{day:02d}T10:00:00Z",
+            'updated_at': f"2025-10-{day:02d}T12:00:00Z",
+            'assignee': None,
+            'state': 'open'
+        })
+
+    return {'items': items, 'repositories': repositories}
+
+
+def load_fixtures(path: str = FIXTURES_PATH) -> Dict:
+    """Recorded fixtures from ``path`` if present, else the seeded generated set"""
+
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return generate_fixtures()
+
+
+class FakeGitHub:
+    """State shared by all handler threads: fixtures, rate limits and fault settings"""
+
+    def __init__(self, fixtures: Dict, latency: float = 0.05, jitter: float = 0.02,
+                 search_limit: int = 30, core_limit: int = 5000, graphql_limit: int = 5000,
+                 window: float = 60, error_403: float = 0.0, error_422: float = 0.0, seed: int = 0):
+        self.items = fixtures['items']
+        self.repositories = fixtures['repositories']
+        self.latency = latency
+        self.jitter = jitter
+        self.limits = {'search': search_limit, 'core': core_limit, 'graphql': graphql_limit}
+        self.window = window
+        self.error_403 = error_403
+        self.error_422 = error_422
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.windows: Dict = {}  # (token, resource) -> [reset_epoch, used]
+        self.requests = 0
+        self.charged = Counter()  # Quota-counted requests per resource
+        self.bytes_sent = 0  # Response body bytes
+
+    def delay(self):
+        with self.lock:
+            self.requests += 1
+            pause = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+        time.sleep(pause)
+
+    def inject_error(self) -> Optional[int]:
+        with self.lock:
+            roll = self.rng.random()
+        if roll < self.error_403:
+            return 403
+        if roll < self.error_403 + self.error_422:
+            return 422
+        return None
+
+    def consume(self, token: str, resource: str, cost: int = 1) -> Dict[str, str]:
+        """Charge the token's window and return the X-RateLimit-* headers"""
+
+        now = time.time()
+        with self.lock:
+            window = self.windows.get((token, resource))
+            if window is None or window[0] <= now:
+                window = [now + self.window, 0]
+                self.windows[(token, resource)] = window
+            window[1] += cost
+            self.charged[resource] += cost
+            limit = self.limits[resource]
+            return {
+                'X-RateLimit-Limit': str(limit),
+                'X-RateLimit-Remaining': str(max(0, limit - window[1])),
+                # Rounded up like GitHub's: the window has reset by then
+                'X-RateLimit-Reset': str(math.ceil(window[0])),
+                'X-RateLimit-Resource': resource,
+                'X-RateLimit-Used': str(window[1])
+            }
+
+    def search(self, query: str) -> List[Dict]:
+        """Items matching the query's label/language qualifiers, most recently updated first"""
+
+        wanted = [a or b for a, b in _LABEL_QUALIFIER.findall(query)]
+        language = _LANGUAGE_QUALIFIER.search(query)
+        state = _STATE_QUALIFIER.search(query)
+        updated = _UPDATED_QUALIFIER.search(query)
+        matches = []
+        for item in self.items:
+            if state and item['state'] != state.group(1):
+                continue
+            # Fixture timestamps share one ISO format, so strings compare chronologically
+            if updated and (item['updated_at'] < updated.group(2) or
+                            (updated.group(1) == '>' and item['updated_at'] == updated.group(2))):
+                continue
+            names = {label['name'].lower() for label in item['labels']}
+            # Relaxed: half of the requested labels is enough so every query yields results
+            hits = sum(1 for label in wanted if label.lower() in names)
+            if wanted and hits * 2 < len(wanted):
+                continue
+            if language:
+                full_name = item['repository_url'].split('/repos/')[-1]
+                repo_language = self.repositories.get(full_name, {}).get('language', '')
+                if repo_language.lower().replace('+', 'p') != language.group(1).lower():
+                    continue
+            matches.append(item)
+        return sorted(matches, key=lambda item: item['updated_at'], reverse=True)
+
+    def update_issue(self, url: str, **changes) -> Dict:
+        """Change an issue (state, assignee, title, ...) and bump its updated_at to now"""
+
+        with self.lock:
+            item = next(item for item in self.items if item['html_url'] == url)
+            item.update(changes, updated_at=time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()))
+            return item
+
+    def graphql_issue(self, item: Dict) -> Dict:
+        full_name = item['repository_url'].split('/repos/')[-1]
+        owner, _, name = full_name.partition('/')
+        return {
+            'databaseId': item['id'],
+            'number': item['number'],
+            'title': item['title'],
+            'body': item['body'],
+            'url': item['html_url'],
+            'state': item['state'].upper(),
+            'createdAt': item['created_at'],
+            'updatedAt': item['updated_at'],
+            'comments': {'totalCount': item['comments']},
+            'labels': {'nodes': item['labels']},
+            'assignees': {'nodes': [item['assignee']] if item.get('assignee') else []},
+            'repository': dict(self.graphql_repository(full_name), name=name, owner={'login': owner})
+        }
+
+    def graphql_repository(self, full_name: str) -> Optional[Dict]:
+        repo = self.repositories.get(full_name)
+        if repo is None:
+            return None
+        return {
+            'stargazerCount': repo['stars'],
+            'isArchived': repo['archived'],
+            'primaryLanguage': {'name': repo['language']},
+            'repositoryTopics': {'nodes': [{'topic': {'name': topic}} for topic in repo['topics']]}
+        }
+
+
+def make_handler(api: FakeGitHub):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive, like api.github.com
+
+        def log_message(self, format, *args):
+            pass
+
+        def _token(self) -> str:
+            return self.headers.get('Authorization', '') or 'anonymous'
+
+        def _send(self, status: int, payload=None, headers: Optional[Dict] = None):
+            body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            if status == 200 and self.headers.get('If-None-Match') == etag:
+                status, body = 304, b''
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            if status in (200, 304):
+                self.send_header('ETag', etag)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+            with api.lock:
+                api.bytes_sent += len(body)
+
+        def _limited(self, resource: str, cost: int = 1) -> Optional[Dict]:
+            """Charge quota; sends the 403 itself and returns None when exhausted"""
+
+            headers = api.consume(self._token(), resource, cost)
+            if int(headers['X-RateLimit-Remaining']) <= 0 and int(headers['X-RateLimit-Used']) > api.limits[resource]:
+                headers['Retry-After'] = str(max(1, int(headers['X-RateLimit-Reset']) - int(time.time())))
+                self._send(403, {'message': 'API rate limit exceeded'}, headers)
+                return None
+            return headers
+
+        def do_GET(self):
+            api.delay()
+            url = urlparse(self.path)
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+            if url.path == '/rate_limit':
+                resources = {}
+                for resource, limit in api.limits.items():
+                    window = api.windows.get((self._token(), resource), [time.time() + api.window, 0])
+                    resources[resource] = {'limit': limit, 'remaining': max(0, limit - window[1]),
+                                           'reset': int(window[0])}
+                self._send(200, {'resources': resources, 'rate': resources['core']})
+                return
+
+            if url.path == '/search/issues':
+                headers = self._limited('search')
+                if headers is None:
+                    return
+                error = api.inject_error()
+                if error:
+                    self._send(error, {'message': 'Injected error'}, headers)
+                    return
+
+                per_page = min(int(params.get('per_page', 30)), 100)
+                page = int(params.get('page', 1))
+                matches = api.search(params.get('q', ''))
+                start = (page - 1) * per_page
+                if start + per_page < min(len(matches), 1000):
+                    next_params = dict(params, page=page + 1)
+                    headers['Link'] = f'<http://{self.headers.get("Host")}{url.path}?{urlencode(next_params)}>; rel="next"'
+                self._send(200, {
+                    'total_count': len(matches),
+                    'incomplete_results': False,
+                    'items': matches[start:start + per_page]
+                }, headers)
+                return
+
+            if url.path.startswith('/repos/'):
+                headers = self._limited('core')
+                if headers is None:
+                    return
+                full_name = url.path[len('/repos/'):]
+                repo = api.repositories.get(full_name)
+                if repo is None:
+                    self._send(404, {'message': 'Not Found'}, headers)
+                    return
+                self._send(200, {
+                    'full_name': full_name,
+                    'stargazers_count': repo['stars'],
+                    'language': repo['language'],
+                    'topics': repo['topics'],
+                    'archived': repo['archived']
+                }, headers)
+                return
+
+            self._send(404, {'message': 'Not Found'})
+
+        def do_POST(self):
+            api.delay()
+            if urlparse(self.path).path != '/graphql':
+                self._send(404, {'message': 'Not Found'})
+                return
+            if self._token() == 'anonymous':
+                self._send(401, {'message': 'This endpoint requires you to be authenticated.'})
+                return
+
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            variables = request.get('variables') or {}
+
+            headers = self._limited('graphql')
+            if headers is None:
+                return
+
+            data = {}
+            first = int(variables.get('first', 10))
+            for name, value in variables.items():
+                search_alias = re.fullmatch(r'q(\d+)', name)
+                repo_alias = re.fullmatch(r'o(\d+)', name)
+                if search_alias:
+                    n = search_alias.group(1)
+                    start = int(variables.get(f'c{n}') or 0)
+                    matches = api.search(value)
+                    end = min(start + first, len(matches), 1000)
+                    data[f'q{n}'] = {
+                        'pageInfo': {'hasNextPage': end < min(len(matches), 1000), 'endCursor': str(end)},
+                        'nodes': [api.graphql_issue(item) for item in matches[start:end]]
+                    }
+                elif repo_alias:
+                    n = repo_alias.group(1)
+                    data[f'r{n}'] = api.graphql_repository(f"{value}/{variables.get(f'n{n}', '')}")
+
+            self._send(200, {'data': data}, headers)
+
+    return Handler
+
+
+def start_server(api: FakeGitHub, host: str = '127.0.0.1', port: int = 0) -> ThreadingHTTPServer:
+    """Serve in a daemon thread; the bound port is server.server_address[1]"""
+
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='fake-github', daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the GitHub REST/GraphQL API")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fixtures', default=FIXTURES_PATH)
+    parser.add_argument('--latency', type=float, default=0.05, help="Seconds added to every response")
+    parser.add_argument('--jitter', type=float, default=0.02)
+    parser.add_argument('--search-limit', type=int, default=30, help="Search requests per window")
+    parser.add_argument('--window', type=float, default=60, help="Rate limit window in seconds")
+    parser.add_argument('--error-403', type=float, default=0.0, help="Fraction of searches failing with 403")
+    parser.add_argument('--error-422', type=float, default=0.0, help="Fraction of searches failing with 422")
+    parser.add_argument('--write-fixtures', action='store_true', help="Write the generated fixtures to --fixtures (a starting point for recorded data) and exit")
+    args = parser.parse_args()
+
+    if args.write_fixtures:
+        os.makedirs(os.path.dirname(args.fixtures), exist_ok=True)
+        with open(args.fixtures, 'w', encoding='utf-8') as f:
+            json.dump(generate_fixtures(), f, indent=1)
+        print(f"✅ Wrote fixtures to {args.fixtures}")
+        return
+
+    api = FakeGitHub(load_fixtures(args.fixtures), latency=args.latency, jitter=args.jitter,
+                     search_limit=args.search_limit, window=args.window,
+                     error_403=args.error_403, error_422=args.error_422)
+    server = start_server(api, port=args.port)
+    print(f"🚀 Fake GitHub API on http://127.0.0.1:{server.server_address[1]} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
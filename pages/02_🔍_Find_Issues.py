@@ -2,8 +2,11 @@ import streamlit as st
 from utils.styling import apply_custom_css
 from services.github_service import GitHubService
 from services.ai_service import AIService
+from services.profile_service import ProfileService
+from services.issue_snapshot import issue_snapshot
 import pandas as pd
 import os
+import uuid
 
 # Apply styling
 apply_custom_css()
@@ -15,6 +18,8 @@ if 'issues' not in st.session_state:
     st.session_state.issues = []
 if 'github_token' not in st.session_state:
     st.session_state.github_token = os.getenv('GITHUB_TOKEN', '')
+if 'issues_refresh' not in st.session_state:
+    st.session_state.issues_refresh = None
 
 st.title("🔍 Find Perfect Issues")
 
@@ -39,7 +44,7 @@ def main():
     # Search controls
     st.markdown("### 🎯 Issue Discovery")
     
-    col1, col2, col3 = st.columns([2, 1, 1])
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
     
     with col1:
         search_type = st.selectbox(
@@ -54,44 +59,132 @@ def main():
         if st.button("🔍 Find Issues", use_container_width=True):
             find_issues(search_type, max_issues)
     
+    with col4:
+        if st.button("🔄 Refresh", use_container_width=True):
+            # A new nonce bypasses cached results for this user only
+            st.session_state.issues_refresh = uuid.uuid4().hex
+            find_issues(search_type, max_issues, refresh=True)
+    
     # Display issues if available
     if st.session_state.issues:
         display_issues()
     else:
         st.info("👆 Click 'Find Issues' to discover open source opportunities!")
 
-@st.cache_data(show_spinner=True)
-def find_issues(search_type, max_issues):
-    """Find issues based on user profile and search type"""
+class CandidatesNotCached(Exception):
+    """Raised by cached_candidate_issues on a lookup miss, so st.cache_data stores nothing"""
+
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def cached_candidate_issues(profile_key, search_type, max_issues, authenticated, nonce, _issues=None):
+    """Candidate issues stored for a profile: looked up without ``_issues``, stored with them.
+    
+    Keyed on the profile fingerprint, search strategy, issue count and
+    whether the user has a token; ``nonce`` changes on each Refresh click
+    and gives that user their own entry. The search itself runs outside
+    this function so the page can show its batches as they arrive.
+    AI scores are not cached here: AIService serves repeats from its
+    shared analysis cache.
+    """
+    
+    if _issues is None:
+        raise CandidatesNotCached()
+    return _issues
+
+def fetch_candidate_issues(profile, search_type, max_issues, refresh=False, on_batch=None):
+    """Candidate issues for the current user, searched and cached on a miss.
     
-    with st.spinner("🤖 AI is analyzing thousands of GitHub issues for you..."):
+    ``refresh`` is only true on the Refresh click itself, so later misses
+    don't force a sync again. Empty, fallback or partly failed results are
+    not cached, so they are never served to other users.
+    """
+    
+    key = (ProfileService.get_profile_fingerprint(profile), search_type, max_issues,
+           bool(st.session_state.github_token), st.session_state.issues_refresh)
+    if not refresh:
         try:
-            github_service = GitHubService()
+            return cached_candidate_issues(*key)
+        except CandidatesNotCached:
+            pass
+    
+    github_service = GitHubService()
+    
+    # Fetch issues from GitHub
+    issues = github_service.fetch_issues(
+        skills=profile['skills'],
+        interests=profile['interests'],
+        experience_level=profile['experience_level'],
+        max_results=max_issues,
+        # After a Refresh click, sync changed issues instead of serving cached pages
+        refresh=refresh,
+        # 'index' answers from the crawled local index (python -m services.issue_index)
+        mode=os.getenv('ISSUE_SEARCH_MODE', 'live'),
+        on_batch=on_batch,
+        # Everything the pages fetched, for the semantic pre-ranker to choose from
+        keep_fetched=True
+    )
+    if issues and not github_service.served_fallback and not github_service.failed_pages:
+        cached_candidate_issues(*key, _issues=issues)
+    return issues
+
+def find_issues(search_type, max_issues, refresh=False):
+    """Find issues based on user profile and search type"""
+    
+    try:
+        profile = st.session_state.profile
+        
+        # Show candidates as search pages arrive, then a ranking re-sorted as AI scores arrive
+        preview = st.empty()
+        found = []
+        def show_batch(batch):
+            found.extend(batch)
+            display_candidates_preview(preview, found, max_issues)
+        
+        with st.spinner("🔍 Searching GitHub for Hacktoberfest issues..."):
+            raw_issues = fetch_candidate_issues(profile, search_type, max_issues, refresh, on_batch=show_batch)
+        
+        issues = []
+        if raw_issues:
             ai_service = AIService()
+            for ranked in ai_service.stream_recommendations(raw_issues, profile):
+                issues = ranked[:max_issues]
+                display_ranking_preview(preview, issues)
+        preview.empty()
+        
+        if issues:
+            st.session_state.issues = issues
+            st.success(f"✅ Found {len(st.session_state.issues)} perfect issues for you!")
+        else:
+            st.warning("😕 No issues found matching your criteria. Try adjusting your profile.")
             
-            profile = st.session_state.profile
-            
-            # Fetch issues from GitHub
-            raw_issues = github_service.fetch_issues(
-                skills=profile['skills'],
-                interests=profile['interests'],
-                experience_level=profile['experience_level'],
-                max_results=max_issues
+    except Exception as e:
+        st.error(f"❌ Error finding issues: {str(e)}")
+        # Fallback with sample data
+        st.session_state.issues = get_sample_issues()
+
+def display_candidates_preview(placeholder, issues, limit):
+    """Unranked candidates found so far, while the search is still running"""
+    
+    with placeholder.container():
+        st.markdown(f"#### 📥 Found {len(issues)} candidates so far...")
+        for issue in issues[:limit]:
+            st.markdown(
+                f"⏳ [{issue['title']}]({issue['url']}) "
+                f"· {issue.get('repository', {}).get('name', 'Unknown')}"
+            )
+
+def display_ranking_preview(placeholder, issues):
+    """Compact live ranking while AI scores arrive (no widgets, so it can be redrawn)"""
+    
+    pending = sum(1 for issue in issues if issue.get('ai_pending'))
+    with placeholder.container():
+        if pending:
+            st.markdown(f"#### 🤖 AI is refining {pending} of {len(issues)} scores...")
+        for issue in issues:
+            marker = '⏳' if issue.get('ai_pending') else '🤖'
+            st.markdown(
+                f"{marker} **{issue.get('ai_score', 0)}/10** · [{issue['title']}]({issue['url']}) "
+                f"· {issue.get('repository', {}).get('name', 'Unknown')}"
             )
-            
-            if raw_issues:
-                # Get AI recommendations
-                recommended_issues = ai_service.get_recommendations(raw_issues, profile)
-                st.session_state.issues = recommended_issues[:max_issues]
-                
-                st.success(f"✅ Found {len(st.session_state.issues)} perfect issues for you!")
-            else:
-                st.warning("😕 No issues found matching your criteria. Try adjusting your profile.")
-                
-        except Exception as e:
-            st.error(f"❌ Error finding issues: {str(e)}")
-            # Fallback with sample data
-            st.session_state.issues = get_sample_issues()
 
 def display_issues():
     """Display found issues with rich formatting"""
@@ -245,6 +338,10 @@ def display_issue_card(issue, index):
 
 def get_sample_issues():
     """Sample issues for fallback"""
+    # Real issues from the memory-mapped snapshot when one is configured
+    if issue_snapshot is not None and len(issue_snapshot):
+        return issue_snapshot.top(10)
+    
     return [
         {
             'id': 1,
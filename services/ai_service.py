@@ -1,12 +1,58 @@
+import os
 import requests
 import json
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from typing import Iterator, List, Dict, Optional, Set
 import streamlit as st
 import ollama
+from services.analysis_cache import AnalysisCache, analysis_cache as shared_analysis_cache
+from services.semantic_matcher import SemanticMatcher, semantic_matcher as shared_semantic_matcher
+
+# Model calls in flight at once (match the server's OLLAMA_NUM_PARALLEL)
+MAX_CONCURRENT_ANALYSES = int(os.getenv('OLLAMA_MAX_CONCURRENCY', '4'))
+
+# Seconds a search waits for AI scores before using the fallback score
+ANALYSIS_DEADLINE = float(os.getenv('OLLAMA_DEADLINE', '20'))
+
+# Issues packed into one prompt (1 analyses each issue on its own)
+ANALYSIS_BATCH_SIZE = int(os.getenv('OLLAMA_BATCH_SIZE', '8'))
+
+SYSTEM_PROMPT = 'You are an expert open source mentor. Analyze GitHub issues and provide recommendations.'
+
+# Structured output for batched prompts: one object per issue, matched back by id
+BATCH_RESPONSE_SCHEMA = {
+    'type': 'array',
+    'items': {
+        'type': 'object',
+        'properties': {
+            'id': {'type': 'integer'},
+            'score': {'type': 'integer'},
+            'summary': {'type': 'string'},
+            'time': {'type': 'string'},
+            'learning': {'type': 'string', 'enum': ['High', 'Medium', 'Low']}
+        },
+        'required': ['id', 'score', 'summary', 'time', 'learning']
+    }
+}
 
 class AIService:
-    def __init__(self):
+    # Issues analysed by the model per search
+    MAX_ANALYZED_ISSUES = 15
+    
+    def __init__(self, client: Optional[ollama.Client] = None,
+                 max_concurrency: Optional[int] = None, deadline: Optional[float] = None,
+                 batch_size: Optional[int] = None, analysis_cache: Optional[AnalysisCache] = None,
+                 semantic_matcher: Optional[SemanticMatcher] = None):
         self.ollama_model = "qwen2:0.5b "
+        self.batch_size = max(1, batch_size or ANALYSIS_BATCH_SIZE)
+        self.max_concurrency = max_concurrency or MAX_CONCURRENT_ANALYSES
+        self.deadline = deadline or ANALYSIS_DEADLINE
+        # The HTTP timeout matches the deadline so an abandoned call frees its worker
+        self.client = client or ollama.Client(timeout=self.deadline)
+        # Analyses by (issue content, coarse profile, model), shared by every user
+        self.analysis_cache = analysis_cache or shared_analysis_cache
+        # Embedding pre-ranker that picks which candidates reach the model
+        self.semantic_matcher = semantic_matcher or shared_semantic_matcher
     
     def get_recommendations(self, issues: List[Dict], profile: Dict) -> List[Dict]:
         """Get AI-powered recommendations for issues"""
@@ -15,82 +61,202 @@ class AIService:
             return []
         
         try:
-            # Analyze issues with AI
-            scored_issues = self._analyze_issues_with_ai(issues, profile)
-            
-            # Sort by AI score
-            scored_issues.sort(key=lambda x: x.get('ai_score', 0), reverse=True)
-            
-            return scored_issues
+            # Analyze issues with AI (ranked by AI score, unanalysed candidates last)
+            return self._analyze_issues_with_ai(issues, profile)
             
         except Exception as e:
             st.warning(f"AI analysis unavailable: {str(e)}")
             # Fallback to simple scoring
             return self._fallback_scoring(issues, profile)
     
+    def stream_recommendations(self, issues: List[Dict], profile: Dict) -> Iterator[List[Dict]]:
+        """Yield the ranked issues at once, then again each time AI scores arrive.
+        
+        The first ranking uses cached analyses and the fallback score, so it
+        needs no model call; issues still waiting for the model carry
+        ``ai_pending``. Every yield is the complete list: the issues sent to
+        the model sorted by AI score, then the rest in semantic order.
+        """
+        
+        if not issues:
+            return
+        
+        try:
+            yield from self._score_progressively(issues, profile)
+        except Exception as e:
+            st.warning(f"AI analysis unavailable: {str(e)}")
+            yield self._fallback_scoring(issues, profile)
+    
     def _analyze_issues_with_ai(self, issues: List[Dict], profile: Dict) -> List[Dict]:
-        """Analyze issues using Ollama"""
+        """Analyze issues using Ollama, a batch of issues per prompt and several prompts at once"""
         
         scored_issues = []
+        for scored_issues in self._score_progressively(issues, profile):
+            pass
+        return scored_issues
+    
+    def _score_progressively(self, issues: List[Dict], profile: Dict) -> Iterator[List[Dict]]:
+        """Every issue scored so far, first from the cache and fallback, then after each AI batch.
+        
+        Only the candidates closest to the profile by embedding similarity
+        are sent to the model, and ranked by score; the rest follow them in
+        semantic order with the fallback score, which is never compared
+        with AI scores.
+        The first ranking orders candidates by cached embeddings only, so
+        it never waits on the embedding model either.
+        Issues analysed before for a similar profile come from the analysis
+        cache without a model call. The rest share one deadline, so scoring
+        takes about as long as the slowest model call; issues not scored by
+        then (or whose call failed, or whose entry in a batch answer was
+        unusable) keep the fallback score.
+        """
+        
+        # The first ranking never waits on the embedding model: only cached embeddings count
+        candidates = issues
+        ranked = self.semantic_matcher.rank(candidates, profile, cached_only=True) or candidates
+        issues = ranked[:self.MAX_ANALYZED_ISSUES]
+        analyses = self.analysis_cache.get_many(issues, profile, self.ollama_model)
+        missing = [index for index, analysis in enumerate(analyses) if analysis is None]
+        yield self._ranked(self._scored(issues, analyses, profile, pending=set(missing))) + self._unanalysed(ranked, profile)
+        
+        # Limit model calls: the best semantic matches, or the first ones without embeddings
+        ranked = self.semantic_matcher.rank(candidates, profile) or ranked
+        issues = ranked[:self.MAX_ANALYZED_ISSUES]
+        tail = self._unanalysed(ranked, profile)
+        analyses = self.analysis_cache.get_many(issues, profile, self.ollama_model)
+        missing = [index for index, analysis in enumerate(analyses) if analysis is None]
+        if not missing:
+            yield self._ranked(self._scored(issues, analyses, profile, pending=set())) + tail
+            return
+        
         context = self._create_user_context(profile)
+        batches = [missing[start:start + self.batch_size] for start in range(0, len(missing), self.batch_size)]
         
-        # Process issues in batches to avoid overwhelming the AI
-        for issue in issues[:15]:  # Limit for performance
-            try:
-                analysis = self._analyze_single_issue(issue, context)
-                
-                issue_with_analysis = issue.copy()
-                issue_with_analysis.update({
-                    'ai_score': analysis.get('score', 5),
-                    'ai_summary': analysis.get('summary', 'AI analysis in progress...'),
-                    'estimated_time': analysis.get('time', '2-4 hours'),
-                    'learning_opportunity': analysis.get('learning', 'Medium')
-                })
-                
-                scored_issues.append(issue_with_analysis)
-                
-            except Exception as e:
-                # If AI fails for this issue, use fallback
-                issue['ai_score'] = self._calculate_fallback_score(issue, profile)
-                issue['ai_summary'] = f"Issue in {issue['repository']['name']}: {issue['title'][:100]}..."
-                scored_issues.append(issue)
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(batches))))
+        futures = {executor.submit(self._analyze_batch, [issues[index] for index in batch], context): batch
+                   for batch in batches}
+        pending = set(missing)
+        try:
+            for future in as_completed(futures, timeout=self.deadline):
+                batch = futures[future]
+                pending.difference_update(batch)
+                if future.exception() is None:
+                    for index, analysis in zip(batch, future.result()):
+                        if analysis is not None:
+                            analyses[index] = analysis
+                            self.analysis_cache.put(issues[index], profile, self.ollama_model, analysis)
+                yield self._ranked(self._scored(issues, analyses, profile, pending)) + tail
+        except TimeoutError:
+            # Late issues keep their fallback score
+            yield self._ranked(self._scored(issues, analyses, profile, pending=set())) + tail
+        finally:
+            # Don't block on late calls: queued ones are dropped, running ones time out on their own
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    @staticmethod
+    def _ranked(scored_issues: List[Dict]) -> List[Dict]:
+        return sorted(scored_issues, key=lambda x: x.get('ai_score', 0), reverse=True)
+    
+    def _unanalysed(self, ranked: List[Dict], profile: Dict) -> List[Dict]:
+        """Candidates past the ones the model sees, on the fallback score"""
         
+        return [self._with_fallback(issue, profile) for issue in ranked[self.MAX_ANALYZED_ISSUES:]]
+    
+    def _scored(self, issues: List[Dict], analyses: List[Optional[Dict]], profile: Dict,
+                pending: Set[int]) -> List[Dict]:
+        scored_issues = []
+        for index, (issue, analysis) in enumerate(zip(issues, analyses)):
+            if analysis is not None:
+                scored_issues.append(self._with_analysis(issue, analysis))
+                continue
+            scored_issue = self._with_fallback(issue, profile)
+            if index in pending:
+                scored_issue['ai_pending'] = True
+            scored_issues.append(scored_issue)
         return scored_issues
     
-    def _analyze_single_issue(self, issue: Dict, context: str) -> Dict:
-        """Analyze a single issue with AI"""
+    def _analyze_batch(self, issues: List[Dict], context: str) -> List[Optional[Dict]]:
+        """One analysis per issue, None where the model gave no usable answer"""
+        
+        if len(issues) == 1:
+            return [self._analyze_single_issue(issues[0], context)]
+        return self._analyze_issue_batch(issues, context)
+    
+    def _with_analysis(self, issue: Dict, analysis: Dict) -> Dict:
+        issue_with_analysis = issue.copy()
+        issue_with_analysis.update({
+            'ai_score': analysis.get('score', 5),
+            'ai_summary': analysis.get('summary', 'AI analysis in progress...'),
+            'estimated_time': analysis.get('time', '2-4 hours'),
+            'learning_opportunity': analysis.get('learning', 'Medium')
+        })
+        return issue_with_analysis
+    
+    def _with_fallback(self, issue: Dict, profile: Dict) -> Dict:
+        """The issue scored without AI, for when its analysis failed or came too late"""
+        
+        issue_with_score = issue.copy()
+        issue_with_score.update({
+            'ai_score': self._calculate_fallback_score(issue, profile),
+            'ai_summary': f"Issue in {issue['repository']['name']}: {issue['title'][:100]}...",
+            'estimated_time': '2-4 hours',
+            'learning_opportunity': 'Medium'
+        })
+        return issue_with_score
+    
+    def _analyze_single_issue(self, issue: Dict, context: str) -> Optional[Dict]:
+        """Analyze a single issue with AI, None if the answer has no usable score.
+        
+        Errors propagate so the caller can fall back.
+        """
         
         prompt = self._create_analysis_prompt(issue, context)
         
-        try:
-            response = ollama.chat(
-                model=self.ollama_model,
-                messages=[
-                    {
-                        'role': 'system',
-                        'content': 'You are an expert open source mentor. Analyze GitHub issues and provide recommendations.'
-                    },
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                options={
-                    'temperature': 0.3,
-                    'top_p': 0.9
+        response = self.client.chat(
+            model=self.ollama_model,
+            messages=[
+                {
+                    'role': 'system',
+                    'content': SYSTEM_PROMPT
+                },
+                {
+                    'role': 'user',
+                    'content': prompt
                 }
-            )
-            
-            return self._parse_ai_response(response['message']['content'])
-            
-        except Exception as e:
-            # Fallback response
-            return {
-                'score': 6,
-                'summary': f"Great opportunity to work on {issue.get('repository', {}).get('language', 'a')} project!",
-                'time': '2-4 hours',
-                'learning': 'Medium'
+            ],
+            options={
+                'temperature': 0.3,
+                'top_p': 0.9
+            }
+        )
+        
+        return self._parse_ai_response(response['message']['content'], strict=True)
+    
+    def _analyze_issue_batch(self, issues: List[Dict], context: str) -> List[Optional[Dict]]:
+        """Analyze several issues with one prompt and a JSON-array answer"""
+        
+        prompt = self._create_batch_prompt(issues, context)
+        
+        response = self.client.chat(
+            model=self.ollama_model,
+            messages=[
+                {
+                    'role': 'system',
+                    'content': SYSTEM_PROMPT
+                },
+                {
+                    'role': 'user',
+                    'content': prompt
+                }
+            ],
+            format=BATCH_RESPONSE_SCHEMA,
+            options={
+                'temperature': 0.3,
+                'top_p': 0.9
             }
+        )
+        
+        return self._parse_batch_response(response['message']['content'], len(issues))
     
     def _create_analysis_prompt(self, issue: Dict, context: str) -> str:
         """Create AI analysis prompt"""
@@ -118,6 +284,31 @@ class AIService:
         Learning: High/Medium/Low
         """
     
+    def _create_batch_prompt(self, issues: List[Dict], context: str) -> str:
+        """Create one AI analysis prompt for several issues, numbered from 1"""
+        
+        issue_blocks = "\n".join(f"""
+        Issue {n}: {issue['title']}
+        Repository: {issue['repository']['name']}
+        Language: {issue['repository'].get('language', 'Unknown')}
+        Labels: {', '.join(issue['labels'])}
+        Description: {issue.get('body', '')[:300]}...
+        """ for n, issue in enumerate(issues, 1))
+        
+        return f"""
+        Analyze these {len(issues)} GitHub issues for a developer with the following profile:
+        {context}
+        {issue_blocks}
+        For each issue provide a score (1-10) and brief analysis focusing on:
+        - How well this matches their skills
+        - Learning opportunity
+        - Estimated time to complete
+        - Why this is good for their level
+        
+        Respond with only a JSON array holding one object per issue, using the issue number as id:
+        [{{"id": 1, "score": 7, "summary": "Brief explanation", "time": "2-4 hours", "learning": "High"}}]
+        """
+    
     def _create_user_context(self, profile: Dict) -> str:
         """Create user context for AI"""
         
@@ -128,8 +319,12 @@ class AIService:
         Goal: Find good open source contributions for Hacktoberfest
         """
     
-    def _parse_ai_response(self, response: str) -> Dict:
-        """Parse AI response into structured data"""
+    def _parse_ai_response(self, response: str, strict: bool = False) -> Optional[Dict]:
+        """Parse AI response into structured data
+        
+        With ``strict``, an answer without a 1-10 score gives None instead of
+        the default score, so it is neither used nor cached.
+        """
         
         try:
             # Extract structured information from AI response
@@ -147,6 +342,9 @@ class AIService:
                 elif 'Learning:' in line:
                     result['learning'] = line.split('Learning:')[1].strip()
             
+            if strict and not 1 <= result.get('score', 0) <= 10:
+                return None
+            
             # Set defaults if parsing failed
             if 'score' not in result:
                 result['score'] = 6
@@ -160,6 +358,8 @@ class AIService:
             return result
             
         except Exception:
+            if strict:
+                return None
             # Fallback parsing
             return {
                 'score': 6,
@@ -168,6 +368,43 @@ class AIService:
                 'learning': 'Medium'
             }
     
+    def _parse_batch_response(self, response: str, count: int) -> List[Optional[Dict]]:
+        """Map a JSON-array answer back to issues by id; malformed or missing entries are None"""
+        
+        try:
+            data = json.loads(response)
+        except ValueError:
+            # Salvage an array wrapped in prose or a code fence
+            start, end = response.find('['), response.rfind(']')
+            try:
+                data = json.loads(response[start:end + 1]) if 0 <= start < end else []
+            except ValueError:
+                data = []
+        if isinstance(data, dict):
+            # Some models wrap the array in an object
+            data = next((value for value in data.values() if isinstance(value, list)), [data])
+        
+        analyses: List[Optional[Dict]] = [None] * count
+        for item in data if isinstance(data, list) else []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item['id']) - 1
+                score = int(str(item['score']).split('/')[0])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not 0 <= index < count or analyses[index] is not None or not 1 <= score <= 10:
+                continue
+            
+            analysis = {'score': score}
+            for key in ('summary', 'time', 'learning'):
+                value = item.get(key)
+                if isinstance(value, (str, int, float)) and str(value).strip():
+                    analysis[key] = str(value).strip()
+            analyses[index] = analysis
+        
+        return analyses
+    
     def _fallback_scoring(self, issues: List[Dict], profile: Dict) -> List[Dict]:
         """Simple fallback scoring when AI is unavailable"""
         
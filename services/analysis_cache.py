@@ -0,0 +1,69 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+from services.result_cache import ResultCache
+
+
+def issue_fingerprint(issue: Dict) -> str:
+    """Hash of the issue content the model reads: title, body and labels"""
+
+    payload = json.dumps([
+        issue.get('title', ''),
+        issue.get('body') or '',
+        sorted(label.lower() for label in issue.get('labels') or [])
+    ])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def profile_key(profile: Dict, top: int = 5) -> str:
+    """Coarse profile an analysis holds for: experience level, top skills and interests.
+
+    Order and case don't matter, and only the leading entries count, so
+    similar profiles share analyses.
+    """
+
+    skills = sorted({skill.strip().lower() for skill in profile.get('skills', [])[:top]})
+    interests = sorted({interest.strip().lower() for interest in profile.get('interests', [])[:top]})
+    payload = json.dumps([profile.get('experience_level', ''), skills, interests])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class AnalysisCache:
+    """AI issue analyses shared across users and searches.
+
+    Keyed by (issue content, coarse profile, model): an edited issue, a
+    different kind of profile or another model all miss. Expiry, the
+    size bound and hit ratios come from the underlying ResultCache.
+    """
+
+    def __init__(self, cache: Optional[ResultCache] = None):
+        self.cache = cache or ResultCache(ttl=7 * 24 * 3600, max_bytes=16 * 1024 * 1024, table='analyses')
+
+    @staticmethod
+    def _key(issue: Dict, profile: Dict, model: str) -> str:
+        return f"analysis:{model.strip()}:{profile_key(profile)}:{issue_fingerprint(issue)}"
+
+    def get(self, issue: Dict, profile: Dict, model: str) -> Optional[Dict]:
+        return self.cache.get(self._key(issue, profile, model))
+
+    def get_many(self, issues: List[Dict], profile: Dict, model: str) -> List[Optional[Dict]]:
+        return [self.get(issue, profile, model) for issue in issues]
+
+    def put(self, issue: Dict, profile: Dict, model: str, analysis: Dict):
+        self.cache.set(self._key(issue, profile, model), analysis)
+
+    def stats(self) -> Dict:
+        return self.cache.stats()
+
+    def clear(self):
+        self.cache.clear()
+
+
+# Shared by every session, on disk when ISSUE_CACHE_PATH is set
+analysis_cache = AnalysisCache(ResultCache(
+    ttl=float(os.getenv('ANALYSIS_CACHE_TTL', str(7 * 24 * 3600))),
+    max_bytes=int(os.getenv('ANALYSIS_CACHE_MAX_BYTES', str(16 * 1024 * 1024))),
+    path=os.getenv('ISSUE_CACHE_PATH') or None,
+    table='analyses'
+))
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Bulk crawler that harvests Hacktoberfest issues into a JSONL snapshot.
+
+Walks every label/language/topic query the app can build, paginates each
+one, paces itself to leave search quota for interactive users and
+checkpoints after every round, so an interrupted crawl resumes where it
+stopped:
+
+    python -m services.crawler --snapshot issues.jsonl.gz
+
+Set ISSUE_SNAPSHOT_PATH to the snapshot to load it into the local issue
+index when the app starts.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+from typing import Dict, IO, Iterator, List, Optional, Sequence, Set, Tuple
+from services.github_service import GitHubService
+from services.models import Issue
+
+
+def _open(path: str, mode: str) -> IO:
+    # '.gz' snapshots are gzip streams; appended members still read back as one
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def load_snapshot(path: str) -> Iterator[Dict]:
+    """Issues from a crawler snapshot, one formatted issue dict per line"""
+
+    with _open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class IssueCrawler:
+    """Crawls every query shape page by page into a snapshot file and/or an issue index.
+
+    First pages go through ``service.sync_queries``, so re-crawls only
+    fetch what changed since the last one. With an ``index`` and
+    ``prune``, a completed crawl drops indexed issues it no longer saw.
+    Progress is checkpointed after every round when there is somewhere
+    to keep it (``checkpoint_path``, by default next to the snapshot).
+    """
+
+    def __init__(self, service: GitHubService, snapshot_path: Optional[str] = None,
+                 checkpoint_path: Optional[str] = None, per_page: int = 100,
+                 max_pages: int = GitHubService.MAX_SEARCH_PAGES, quota_reserve: int = 5,
+                 batch_size: int = 4, max_retries: int = 3, retry_delay: float = 2.0,
+                 index=None, prune: bool = True, queries: Optional[Sequence[str]] = None):
+        self.service = service
+        self.snapshot_path = snapshot_path
+        self.partial_path = None
+        if snapshot_path:
+            # Same suffix as the snapshot, so a '.gz' partial file is gzipped too
+            root, ext = os.path.splitext(snapshot_path)
+            self.partial_path = f"{root}.partial{ext}"
+        self.checkpoint_path = checkpoint_path or (snapshot_path + '.checkpoint.json' if snapshot_path else None)
+        self.per_page = min(per_page, 100)
+        self.max_pages = min(max_pages, GitHubService.MAX_SEARCH_PAGES)
+        self.quota_reserve = quota_reserve  # Requests always left for interactive users
+        self.batch_size = batch_size  # Queries per round (one GraphQL request)
+        self.max_retries = max_retries  # Per failed page and run; the query stays pending after that
+        self.retry_delay = retry_delay  # Seconds before the first retry, doubling with each failure
+        self.index = index  # IssueIndex filled alongside (or instead of) the snapshot
+        self.prune = prune
+        self.queries = list(queries) if queries is not None else None
+
+    def crawl_queries(self) -> List[str]:
+        """Every distinct label, language and topic query across experience levels"""
+
+        if self.queries is not None:
+            return self.queries
+        return self.service.query_shapes(self.service.PROGRAMMING_LANGUAGES, per_profile=None,
+                                         max_topics=len(self.service.POPULAR_TOPICS))
+
+    def run(self, fresh: bool = False, max_rounds: Optional[int] = None) -> Dict:
+        """Crawl until every query is exhausted (or max_rounds), resuming a checkpoint unless fresh
+
+        A failed page is retried up to ``max_retries`` times with backoff;
+        after that its query stays pending for the next run, and neither is
+        the snapshot finished nor the index pruned.
+        """
+
+        checkpoint = None if fresh else self._load_checkpoint()
+        if checkpoint is None:
+            checkpoint = {'queries': {}, 'issues': 0, 'started_at': time.time()}
+            if self.partial_path and os.path.exists(self.partial_path):
+                os.remove(self.partial_path)
+        seen = self._seen_urls()
+
+        progress = checkpoint['queries']
+        pending = []
+        for query in self.crawl_queries():
+            state = progress.setdefault(query, {'page': 0, 'cursor': None, 'done': False})
+            if not state['done']:
+                pending.append((query, state['page'] + 1, state['cursor']))
+
+        rounds = 0
+        failures: Dict[str, int] = {}
+        while pending and (max_rounds is None or rounds < max_rounds):
+            batch, pending = pending[:self.batch_size], pending[self.batch_size:]
+            self._wait_for_quota(1 if self.service.backend == 'graphql' else len(batch))
+
+            new_issues = []
+            backoff = 0.0
+            for (query, page, page_cursor), (issues, has_next, cursor, last_page) in zip(batch, self._fetch(batch)):
+                if has_next is None:
+                    # A failed page is not the last page: retry it later, or leave the query pending
+                    failures[query] = failures.get(query, 0) + 1
+                    if failures[query] <= self.max_retries:
+                        pending.append((query, page, page_cursor))
+                        backoff = max(backoff, self.retry_delay * 2 ** (failures[query] - 1))
+                    continue
+                for issue in issues:
+                    if issue['url'] not in seen:
+                        seen.add(issue['url'])
+                        new_issues.append(issue)
+                done = not has_next or last_page >= self.max_pages
+                progress[query] = {'page': last_page, 'cursor': cursor, 'done': done}
+                if not done:
+                    # Round-robin so every query gets its first pages early
+                    pending.append((query, last_page + 1, cursor))
+
+            # Crawled issues carry real stars/topics so loading or searching them needs no lookups
+            self.service.repo_metadata.enrich(new_issues, self.service.fetch_repository_metadata)
+            self._append(new_issues)
+            if self.index is not None:
+                self.index.add(new_issues, indexed_at=checkpoint['started_at'])
+            # Counted from the snapshot itself, which may be ahead of an interrupted checkpoint
+            checkpoint['issues'] = len(seen) if self.partial_path else checkpoint['issues'] + len(new_issues)
+            self._save_checkpoint(checkpoint)
+            rounds += 1
+            if backoff and pending:
+                time.sleep(min(backoff, 60.0))
+
+        stats = {
+            'queries': len(progress),
+            'remaining': sum(1 for state in progress.values() if not state['done']),
+            'failed': sum(1 for count in failures.values() if count > self.max_retries),
+            'issues': checkpoint['issues'],
+            'rounds': rounds,
+            'pruned': 0
+        }
+        if stats['remaining'] == 0:
+            if self.index is not None and self.prune:
+                # Only a complete crawl knows which issues are gone
+                stats['pruned'] = self.index.prune(before=checkpoint['started_at'])
+            self._finish()
+        return stats
+
+    def _fetch(self, batch: List[Tuple[str, int, Optional[str]]]) -> List[Tuple]:
+        """(issues, has_next, cursor, last page) per pending query; first pages come synced"""
+
+        results: List[Optional[Tuple]] = [None] * len(batch)
+        first = [index for index, (_, page, _) in enumerate(batch) if page == 1]
+        later = [index for index, (_, page, _) in enumerate(batch) if page > 1]
+        if first:
+            synced = self.service.sync_queries([batch[index][0] for index in first], self.per_page,
+                                               concurrent=False, force=True)
+            for index, result in zip(first, synced):
+                results[index] = result
+        if later:
+            pages = [batch[index] for index in later]
+            for index, (query, page, _), (issues, has_next, cursor) in zip(
+                    later, pages, self.service.fetch_round(pages, self.per_page, concurrent=False, cache=False)):
+                # Keep the synced entry growing, so the next crawl's sync covers these pages too
+                self.service.issue_store.extend(self.service.backend, query, issues, page, has_next, cursor)
+                results[index] = (issues, has_next, cursor, page)
+        return results
+
+    def _wait_for_quota(self, cost: int):
+        """Sleep until a round fits without eating into the interactive reserve"""
+
+        resource = 'graphql' if self.service.backend == 'graphql' else 'search'
+        while True:
+            # Summed over the service's token pool
+            snapshot = self.service.token_pool.snapshot(resource)
+            deficit = self.quota_reserve + cost - snapshot['remaining']
+            if deficit <= 0 and snapshot['wait'] <= 0:
+                return
+            # Quota only comes back when a window resets
+            reset_wait = snapshot['resets_in'] if deficit > 0 else 0.0
+            time.sleep(max(snapshot['wait'], reset_wait, 0.5))
+
+    def _append(self, issues: List[Dict]):
+        if not issues or not self.partial_path:
+            return
+        with _open(self.partial_path, 'a') as f:
+            for issue in issues:
+                data = issue.to_dict() if isinstance(issue, Issue) else issue
+                f.write(json.dumps(data, separators=(',', ':')) + '\n')
+
+    def _seen_urls(self) -> Set[str]:
+        if not self.partial_path or not os.path.exists(self.partial_path):
+            return set()
+        return {issue['url'] for issue in load_snapshot(self.partial_path)}
+
+    def _load_checkpoint(self) -> Optional[Dict]:
+        if not self.checkpoint_path:
+            return None
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_checkpoint(self, checkpoint: Dict):
+        if not self.checkpoint_path:
+            return
+        # Write then rename, so an interrupt never leaves a torn checkpoint
+        temp_path = self.checkpoint_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, separators=(',', ':'))
+        os.replace(temp_path, self.checkpoint_path)
+
+    def _finish(self):
+        if self.partial_path and os.path.exists(self.partial_path):
+            os.replace(self.partial_path, self.snapshot_path)
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Harvest Hacktoberfest issues into a JSONL snapshot")
+    parser.add_argument('--snapshot', default='hacktoberfest_issues.jsonl.gz',
+                        help="Output file (.gz for a gzipped snapshot)")
+    parser.add_argument('--checkpoint', help="Progress file (default: <snapshot>.checkpoint.json)")
+    parser.add_argument('--max-pages', type=int, default=GitHubService.MAX_SEARCH_PAGES, help="Result pages per query")
+    parser.add_argument('--reserve', type=int, default=5, help="Search requests always left for the app")
+    parser.add_argument('--fresh', action='store_true', help="Ignore an existing checkpoint and start over")
+    args = parser.parse_args()
+
+    crawler = IssueCrawler(
+        GitHubService(token=os.getenv('GITHUB_TOKEN') or None),
+        args.snapshot,
+        checkpoint_path=args.checkpoint,
+        max_pages=args.max_pages,
+        quota_reserve=args.reserve
+    )
+    print(f"Crawling {len(crawler.crawl_queries())} query shapes via {crawler.service.backend} (Ctrl+C to pause)")
+
+    try:
+        stats = crawler.run(fresh=args.fresh)
+    except KeyboardInterrupt:
+        print(f"⏸️ Paused, progress saved to {crawler.checkpoint_path}; run again to resume")
+        return
+
+    if stats['remaining']:
+        print(f"⚠️ {stats['failed']} queries kept failing, {stats['remaining']} unfinished; "
+              f"run again to retry ({stats['issues']} issues so far)")
+        return
+    print(f"✅ {stats['issues']} issues from {stats['queries']} queries written to {args.snapshot}")
+
+
+if __name__ == "__main__":
+    main()
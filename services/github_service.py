@@ -1,11 +1,131 @@
 import requests
+import json
+import os
+import threading
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Iterator, List, Dict, Optional, Sequence, Tuple
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from services.label_classifier import (
+    HAS_BEGINNER, HAS_GOOD_FIRST_ISSUE, HAS_HACKTOBERFEST, HAS_HELP_WANTED, label_classifier
+)
+from services.http_cache import HTTPCache, http_cache as shared_http_cache
+from services.http_session import REQUEST_TIMEOUT, get_session
+from services.issue_index import IssueIndex, issue_index as shared_issue_index
+from services.issue_snapshot import IssueSnapshot, issue_snapshot as shared_issue_snapshot
+from services.issue_store import IssueStore, issue_store as shared_issue_store
+from services.models import Issue
+from services.repo_metadata import RepoMetadataStore, repo_metadata as shared_repo_metadata
+from services.result_cache import ResultCache, issue_cache as shared_issue_cache, normalize_query
+from services.query_planner import QueryPlanner, query_planner as shared_query_planner
+from services.rate_limiter import RateLimiter, rate_limiter as shared_rate_limiter
+from services.token_pool import TokenPool, service_tokens
+
+# Label points for ranking, precomputed for every combination of the priority bits
+PRIORITY_LABEL_MASK = HAS_HACKTOBERFEST | HAS_GOOD_FIRST_ISSUE | HAS_HELP_WANTED | HAS_BEGINNER
+PRIORITY_LABEL_POINTS = {
+    bits: sum(points for flag, points in (
+        (HAS_HACKTOBERFEST, 10), (HAS_GOOD_FIRST_ISSUE, 8), (HAS_HELP_WANTED, 6), (HAS_BEGINNER, 5)
+    ) if bits & flag)
+    for bits in range(PRIORITY_LABEL_MASK + 1) if bits & ~PRIORITY_LABEL_MASK == 0
+}
+
+# Issue fields requested for every GraphQL search alias
+GRAPHQL_SEARCH_FRAGMENT = """
+fragment SearchPage on SearchResultItemConnection {
+  pageInfo { hasNextPage endCursor }
+  nodes {
+    ... on Issue {
+      databaseId
+      number
+      title
+      body
+      url
+      state
+      createdAt
+      updatedAt
+      comments { totalCount }
+      labels(first: 20) { nodes { name } }
+      assignees(first: 5) { nodes { login } }
+      repository {
+        name
+        owner { login }
+        stargazerCount
+        isArchived
+        primaryLanguage { name }
+        repositoryTopics(first: 10) { nodes { topic { name } } }
+      }
+    }
+  }
+}
+"""
+
+# Repository fields requested for bulk metadata lookups
+GRAPHQL_REPO_FRAGMENT = """
+fragment RepoMeta on Repository {
+  stargazerCount
+  isArchived
+  primaryLanguage { name }
+  repositoryTopics(first: 10) { nodes { topic { name } } }
+}
+"""
 
 class GitHubService:
-    def __init__(self, token: Optional[str] = None):
-        self.base_url = "https://api.github.com"
+    # Longest we block an interactive search waiting for quota before giving up
+    MAX_RATE_LIMIT_WAIT = 30
+    
+    # The Search API never returns more than 1000 results (10 pages of 100)
+    MAX_SEARCH_PAGES = 10
+    
+    # Queries run at once for one search (more only replace exhausted ones)
+    MAX_QUERIES_PER_SEARCH = 4
+    
+    # Page sizes requests are rounded up to, so cache keys are shared
+    PAGE_SIZES = (10, 25, 50, 100)
+    
+    # Repository lookups per search when only the REST API is available
+    MAX_REST_REPO_LOOKUPS = 10
+    
+    # Core requests REST repository lookups leave untouched for everything else
+    REST_REPO_LOOKUP_RESERVE = 20
+    
+    # Hacktoberfest labels (both current and historical)
+    HACKTOBERFEST_LABELS = ('hacktoberfest', 'hacktoberfest2025', 'hacktoberfest-accepted', 'hacktober', 'october')
+    
+    # Search language qualifiers skills are mapped to
+    PROGRAMMING_LANGUAGES = (
+        'python', 'javascript', 'typescript', 'java', 'go', 'rust',
+        'cpp', 'csharp', 'php', 'ruby', 'swift', 'kotlin', 'html', 'css'
+    )
+    
+    # Topics of popular Hacktoberfest repositories
+    POPULAR_TOPICS = (
+        'web-development', 'machine-learning', 'python', 'javascript',
+        'react', 'open-source', 'beginner-friendly', 'documentation'
+    )
+    
+    # Difficulties an index search is limited to per experience level (others: any)
+    INDEX_DIFFICULTIES = {'beginner': ('easy',)}
+    
+    # Profile experience levels, each building its own label queries
+    EXPERIENCE_LEVELS = ('beginner', 'intermediate', 'advanced')
+    
+    def __init__(self, token: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None,
+                 session: Optional[requests.Session] = None,
+                 http_cache: Optional[HTTPCache] = None,
+                 issue_cache: Optional[ResultCache] = None,
+                 backend: Optional[str] = None,
+                 repo_metadata: Optional[RepoMetadataStore] = None,
+                 base_url: Optional[str] = None,
+                 issue_store: Optional[IssueStore] = None,
+                 issue_index: Optional[IssueIndex] = None,
+                 issue_snapshot: Optional[IssueSnapshot] = None,
+                 token_pool: Optional[TokenPool] = None,
+                 query_planner: Optional[QueryPlanner] = None):
+        # Overridable for GitHub Enterprise or a local stand-in server
+        self.base_url = (base_url or os.getenv('GITHUB_API_URL') or "https://api.github.com").rstrip('/')
         self.headers = {
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'Hacktoberfest-Mentor-2025/1.0'
@@ -14,58 +134,400 @@ class GitHubService:
         # Use token from session state if available
         if not token and hasattr(st.session_state, 'github_token') and st.session_state.github_token:
             token = st.session_state.github_token
+        
+        # Pacing is shared by every service using the same token in this process
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        
+        # A user's own token is used alone; otherwise requests spread over the service tokens
+        self.token_pool = token_pool or TokenPool([token] if token else service_tokens(), self.rate_limiter)
+        token = self.token_pool.tokens[0][0]
             
         if token:
-            self.headers['Authorization'] = f'token {token}'
-            self.rate_limit = 5000  # Authenticated rate limit
+            self.rate_limit = 5000 * len(self.token_pool)  # Authenticated rate limit
         else:
             self.rate_limit = 60   # Unauthenticated rate limit
+        
+        # Keep-alive connection pool shared across Streamlit sessions
+        self.session = session or get_session()
+        
+        # ETag/Last-Modified store for conditional requests (304s are free)
+        self.http_cache = http_cache or shared_http_cache
+        
+        # Formatted results per normalized query, reused across sessions until TTL
+        self.issue_cache = issue_cache or shared_issue_cache
+        
+        # Per-query results kept current with updated:>= delta searches
+        self.issue_store = issue_store or shared_issue_store
+        
+        # Crawled issues searchable locally (fetch_issues mode='index')
+        self.issue_index = issue_index or shared_issue_index
+        
+        # Memory-mapped real issues served when GitHub is unreachable (None if not configured)
+        self.issue_snapshot = issue_snapshot or shared_issue_snapshot
+        
+        # Past yield per query, used to pick and order queries
+        self.query_planner = query_planner or shared_query_planner
+        
+        # Search pages that failed so far, so callers know when results are incomplete
+        self.failed_pages = 0
+        
+        # Set when fetch_issues answered with fallback issues instead of search results
+        self.served_fallback = False
+        
+        # Stars/language/topics per repository, shared and refreshed in the background
+        self.repo_metadata = repo_metadata or shared_repo_metadata
+        
+
+        # GraphQL returns stars/language/topics in the same request but needs a token
+        self.backend = backend or ('graphql' if token else 'rest')
+        if self.backend == 'graphql' and not token:
+            self.backend = 'rest'
     
     def fetch_issues(self, skills: List[str], interests: List[str], 
-                    experience_level: str, max_results: int = 20) -> List[Dict]:
-        """Fetch Hacktoberfest 2025 issues based on user criteria"""
+                    experience_level: str, max_results: int = 20,
+                    concurrent: bool = True, refresh: bool = False,
+                    mode: str = 'live',
+                    on_batch: Optional[Callable[[List[Dict]], None]] = None,
+                    keep_fetched: bool = False) -> List[Dict]:
+        """Fetch Hacktoberfest 2025 issues based on user criteria
+        
+        ``refresh`` syncs each query's changes now instead of serving cached pages.
+        ``keep_fetched`` returns every issue the pages fetched for max_results
+        hold, best first, instead of cutting to max_results: a re-ranker gets
+        a wider pool for no extra quota.
+        ``on_batch`` sees each batch of new issues as it arrives, unranked,
+        so callers can show progress before the search completes.
+        ``mode='index'`` answers from the local issue index without calling
+        GitHub, falling back to live search while the index is empty.
+        """
+        
+        if mode == 'index' and self.issue_index.available and self.issue_index.count():
+            issues = self.issue_index.search(
+                list(skills) + list(interests),
+                difficulties=self.INDEX_DIFFICULTIES.get(experience_level),
+                limit=max(max_results * 5, 100)
+            )
+            issues = self._prioritize_hacktoberfest_issues(issues)
+            return issues if keep_fetched else issues[:max_results]
         
         try:
-            # Build Hacktoberfest-specific search queries
-            queries = self._build_hacktoberfest_queries(skills, interests, experience_level)
-            
             all_issues = []
-            for query in queries[:4]:  # Limit queries to avoid rate limiting
-                try:
-                    issues = self._search_issues(query, per_page=min(max_results // 4, 25))
-                    all_issues.extend(issues)
-                    time.sleep(1.2)  # Rate limiting - be respectful
-                except Exception as e:
-                    st.warning(f"Query failed: {str(e)}")
-                    continue
+            for batch in self.stream_issues(skills, interests, experience_level, max_results,
+                                            concurrent=concurrent, refresh=refresh):
+                all_issues.extend(batch)
+                if on_batch:
+                    on_batch(batch)
             
             # Remove duplicates and limit results
             unique_issues = self._deduplicate_issues(all_issues)
             
             # Filter and prioritize Hacktoberfest issues
             hacktoberfest_issues = self._prioritize_hacktoberfest_issues(unique_issues)
+            if not keep_fetched:
+                hacktoberfest_issues = hacktoberfest_issues[:max_results]
             
-            return hacktoberfest_issues[:max_results]
+            # Real repository metadata instead of label guesses and zero stars
+            return self.repo_metadata.enrich(hacktoberfest_issues, self.fetch_repository_metadata)
             
         except Exception as e:
             st.error(f"GitHub API Error: {str(e)}")
-            return self._get_hacktoberfest_fallback_issues()
+            self.served_fallback = True
+            return self._get_hacktoberfest_fallback_issues(skills, experience_level, max_results)
+    
+    def stream_issues(self, skills: List[str], interests: List[str], experience_level: str,
+                      max_results: int = 20, max_pages: Optional[int] = None,
+                      concurrent: bool = True, refresh: bool = False) -> Iterator[List[Dict]]:
+        """Yield batches of new, unique issues page by page until max_results are found.
+        
+        The query planner picks the fewest queries expected to cover
+        max_results; each starts from its synced issues (see sync_queries).
+        While results are short, further pages and the next-best spare
+        queries are requested as long as the search quota allows them
+        without waiting. Batches arrive unranked.
+        """
+        
+        # Build Hacktoberfest-specific search queries, best expected yield first
+        candidates = self._candidate_queries(skills, interests, experience_level)
+        queries, spares, per_page = self.query_planner.plan(
+            candidates, max_results, lambda count: self._page_size(max_results, count),
+            max_queries=self.MAX_QUERIES_PER_SEARCH,
+            cached=self._is_synced if refresh else lambda query, per_page: self.cached_for(query, per_page) is not None
+        )
+        if not queries:
+            return
+        
+        max_pages = min(max_pages or self.MAX_SEARCH_PAGES, self.MAX_SEARCH_PAGES)
+        
+        seen_urls = set()
+        found = 0
+        # (query, last page number fetched, GraphQL cursor)
+        pending, results = [], []
+        for query, (issues, has_next, cursor, pages) in zip(queries, self.sync_queries(queries, per_page, concurrent, force=refresh)):
+            pending.append((query, pages, cursor))
+            results.append((issues, has_next, cursor))
+        first_round = True
+        
+        while True:
+            batch = []
+            next_pending = []
+            
+            for (query, page, _), (issues, has_next, cursor) in zip(pending, results):
+                new = 0
+                for issue in issues:
+                    if issue['url'] not in seen_urls:
+                        seen_urls.add(issue['url'])
+                        batch.append(issue)
+                        new += 1
+                # Synced results can span several pages
+                self.query_planner.record(query, per_page * (page if first_round else 1), new)
+                if has_next and page < max_pages:
+                    next_pending.append((query, page + 1, cursor))
+            first_round = False
+            
+            if batch:
+                found += len(batch)
+                yield batch
+            
+            if found >= max_results:
+                break
+            
+            # Top up with the next-best unused queries while more pages won't cover the shortfall
+            expected = sum(self.query_planner.yield_rate(query) * per_page for query, _, _ in next_pending)
+            while spares and expected < max_results - found and len(next_pending) < self.MAX_QUERIES_PER_SEARCH:
+                query = spares.pop(0)
+                next_pending.append((query, 1, None))
+                expected += self.query_planner.yield_rate(query) * per_page
+            if not next_pending:
+                break
+            
+            # Extra pages are opportunistic: never stall a search waiting for quota
+            resource = 'graphql' if self.backend == 'graphql' else 'search'
+            quota = self.token_pool.snapshot(resource)
+            if quota['wait'] > 0 or quota['remaining'] < 1:
+                break
+            if self.backend != 'graphql':
+                # REST sends a request per query, GraphQL one for the whole round
+                next_pending = next_pending[:quota['remaining']]
+            pending = next_pending
+            results = self.fetch_round(pending, per_page, concurrent)
+            for (query, page, _), (issues, has_next, cursor) in zip(pending, results):
+                self.issue_store.extend(self.backend, query, issues, page, has_next, cursor)
+    
+    def _page_size(self, max_results: int, query_count: int) -> int:
+        """Each query's fair share of the target, rounded up to a shared bucket.
+        
+        Bucketing keeps cache keys identical across slightly different
+        max_results values so warmed and cached pages are actually reused.
+        """
+        
+        share = -(-max_results // max(query_count, 1))
+        for size in self.PAGE_SIZES:
+            if share <= size:
+                return size
+        return self.PAGE_SIZES[-1]
+    
+    def page_sizes(self, max_results: int) -> List[int]:
+        """Page sizes a search for max_results can use, whichever number of queries is planned"""
+        
+        return sorted({self._page_size(max_results, count) for count in range(1, self.MAX_QUERIES_PER_SEARCH + 1)})
+    
+    def warm_queries(self, queries: List[str], per_page: int, force: bool = True) -> int:
+        """Bring each query's synced issues up to date in the shared stores"""
+        
+        results = self.sync_queries(queries, per_page, concurrent=False, force=force)
+        return sum(len(issues) for issues, _, _, _ in results)
+    
+    def cached_for(self, query: str, per_page: int) -> Optional[float]:
+        """Seconds until the query's synced or cached first page goes stale, None if neither is fresh"""
+        
+        entry = self._synced_entry(query, per_page)
+        if entry is not None:
+            expires_in = self.issue_cache.ttl - (time.time() - entry['synced_at'])
+            if expires_in > 0:
+                return expires_in
+        
+        if self.backend == 'graphql':
+            return self.issue_cache.expires_in(self._graphql_cache_key(query, min(per_page, 100), None))
+        return self.issue_cache.expires_in(self._search_cache_key(query, min(per_page, 100), 1))
+    
+    def sync_queries(self, queries: List[str], per_page: int, concurrent: bool = True,
+                     force: bool = False) -> List[Tuple[List[Dict], Optional[bool], Optional[str], int]]:
+        """Each query's known issues as (issues, has_next, cursor, pages fetched)
+        
+        A query with a synced store entry is served from it while the entry
+        is younger than the issue cache TTL (unless ``force``); after that
+        only issues updated since the entry's high-water mark are fetched
+        and merged in. Any other query runs the full search and starts an
+        entry from its first page; has_next is None if that search failed.
+        """
+        
+        results: List[Optional[Tuple[List[Dict], Optional[bool], Optional[str], int]]] = [None] * len(queries)
+        full, deltas, stale = [], [], {}
+        now = time.time()
+        for index, query in enumerate(queries):
+            entry = self._synced_entry(query, per_page)
+            if entry is None:
+                full.append(index)
+            elif not force and now - entry['synced_at'] < self.issue_cache.ttl:
+                results[index] = self._synced_result(entry)
+            else:
+                deltas.append((index, entry))
+        
+        if deltas:
+            changes = self._fetch_deltas([(queries[index], entry['high_water']) for index, entry in deltas], concurrent)
+            for (index, entry), changed in zip(deltas, changes):
+                if changed is None:
+                    # Too much changed (or the delta failed): re-run the full search
+                    full.append(index)
+                    stale[index] = entry
+                    continue
+                entry = self.issue_store.merge(self.backend, queries[index], entry, changed)
+                results[index] = self._synced_result(entry)
+        
+        if full:
+            full.sort()
+            pending = [(queries[index], 1, None) for index in full]
+            for index, (issues, has_next, cursor) in zip(full, self.fetch_round(pending, per_page, concurrent, refresh=force)):
+                if has_next is None and index in stale:
+                    # The re-search failed too: keep serving what was synced
+                    results[index] = self._synced_result(stale[index])
+                    continue
+                results[index] = (issues, has_next, cursor, 1)
+                if issues:
+                    self.issue_store.replace(self.backend, queries[index], issues, per_page, has_next, cursor)
+        
+        return results
+    
+    def _synced_entry(self, query: str, per_page: int) -> Optional[Dict]:
+        """The query's store entry if a delta can bring it up to date"""
+        
+        entry = self.issue_store.get(self.backend, query)
+        if entry and entry.get('high_water') and entry['per_page'] >= per_page:
+            return entry
+        return None
+    
+    def _is_synced(self, query: str, per_page: int) -> bool:
+        # A refresh keeps to synced queries: bringing them up to date only costs a delta
+        return self._synced_entry(query, per_page) is not None
+    
+    def _synced_result(self, entry: Dict) -> Tuple[List[Dict], bool, Optional[str], int]:
+        return self._copy_issues(entry['issues']), entry['has_next'], entry['cursor'], entry['pages']
+    
+    def _fetch_deltas(self, cursors: List[Tuple[str, str]], concurrent: bool = True) -> List[Optional[List[Dict]]]:
+        """Issues updated since each (query, high-water mark); None where a full re-search is due"""
+        
+        changed: List[Optional[List[Dict]]] = [[] for _ in cursors]
+        pending = [(index, self._delta_query(query, high_water), 1, None)
+                   for index, (query, high_water) in enumerate(cursors)]
+        
+        while pending:
+            # Deltas are small: the largest page size keeps them to one request per query
+            results = self.fetch_round([item[1:] for item in pending], self.PAGE_SIZES[-1], concurrent, cache=False)
+            next_pending = []
+            for (index, delta_query, page, _), (issues, has_next, cursor) in zip(pending, results):
+                changed[index].extend(issues)
+                if has_next and page < self.MAX_SEARCH_PAGES:
+                    next_pending.append((index, delta_query, page + 1, cursor))
+                elif has_next or has_next is None:
+                    # Too many changes, or a failed page whose changes would be skipped
+                    changed[index] = None
+            pending = next_pending
+        
+        return changed
+    
+    def _delta_query(self, query: str, high_water: str) -> str:
+        """The query narrowed to issues updated since high_water, closed ones included
+        
+        ``updated:>=`` rather than ``>`` so issues updated within the same
+        second as the mark are not missed; merging them again is harmless.
+        """
+        
+        tokens = [token for token in query.split() if token != 'state:open']
+        return ' '.join(tokens + [f'updated:>={high_water}'])
+    
+    def fetch_round(self, pending: List[Tuple[str, int, Optional[str]]], per_page: int,
+                    concurrent: bool = True, refresh: bool = False,
+                    cache: bool = True) -> List[Tuple[List[Dict], Optional[bool], Optional[str]]]:
+        """Fetch one page for each pending (query, page, cursor) via the configured backend,
+        returning (issues, has_next, cursor) in the same order
+        
+        ``has_next`` is None for pages that failed (see ``failed_pages``).
+        ``cache=False`` keeps one-off queries (delta searches) out of the shared caches.
+        """
+        
+        results = None
+        if self.backend == 'graphql':
+            results = self._search_graphql(pending, per_page, refresh=refresh, cache=cache)
+            # Falls back to REST for this round if GraphQL is unavailable
+        
+        if results is None:
+            pages = [(query, page) for query, page, _ in pending]
+            results = [(issues, has_next, None) for issues, has_next in self._run_queries(pages, per_page, concurrent, refresh, cache)]
+        
+        self.failed_pages += sum(1 for _, has_next, _ in results if has_next is None)
+        return results
+    
+    def _run_queries(self, pages: List[Tuple[str, int]], per_page: int,
+                     concurrent: bool = True, refresh: bool = False,
+                     cache: bool = True) -> List[Tuple[List[Dict], Optional[bool]]]:
+        """Fetch (query, page) pairs, returning (issues, has_next) in request order; has_next is None on failure"""
+        
+        def run(query_page):
+            query, page = query_page
+            try:
+                return self._search_page(query, per_page=per_page, page=page, refresh=refresh, cache=cache)
+            except Exception as e:
+                st.warning(f"Query failed: {str(e)}")
+                return [], None
+        
+        if not concurrent or len(pages) <= 1:
+            return [run(query_page) for query_page in pages]
+        return self._map_concurrently(run, pages)
+    
+    def _map_concurrently(self, fn, items: List) -> List:
+        """``fn`` over every item, one thread each, results in item order"""
+        
+        # Worker threads need the script context so st.warning/st.error still render
+        ctx = get_script_run_ctx()
+        initializer = (lambda: add_script_run_ctx(threading.current_thread(), ctx)) if ctx else None
+        with ThreadPoolExecutor(max_workers=len(items), initializer=initializer) as executor:
+            return list(executor.map(fn, items))
+    
+    def query_shapes(self, languages: Sequence[str], per_profile: Optional[int] = 8,
+                     max_topics: int = 3) -> List[str]:
+        """Every distinct query the app builds for profiles with no skill or one of ``languages``.
+        
+        Across all experience levels, each profile keeps its ``per_profile``
+        best-ranked queries like a search does (None keeps them all);
+        ``max_topics`` widens the topic queries.
+        """
+        
+        skill_sets = [[]] + [[language] for language in languages]
+        shapes = {}
+        for experience_level in self.EXPERIENCE_LEVELS:
+            for skills in skill_sets:
+                queries = self._candidate_queries(skills, [], experience_level, max_topics=max_topics)
+                if per_profile is not None:
+                    queries = self.query_planner.rank(queries)[:per_profile]
+                for query in queries:
+                    shapes.setdefault(normalize_query(query), query)
+        return list(shapes.values())
     
     def _build_hacktoberfest_queries(self, skills: List[str], interests: List[str], 
                                    experience_level: str) -> List[str]:
         """Build Hacktoberfest 2025 specific search queries"""
         
-        # Base query for Hacktoberfest 2025
-        base_query = 'state:open type:issue archived:false'
+        queries = self._candidate_queries(skills, interests, experience_level)
+        return self.query_planner.rank(queries)[:8]  # Best expected yield first, limited
+    
+    def _candidate_queries(self, skills: List[str], interests: List[str], experience_level: str,
+                           max_languages: int = 3, max_topics: int = 3) -> List[str]:
+        """Every label/language/topic query for a profile, in building order"""
         
-        # Hacktoberfest labels (both current and historical)
-        hacktoberfest_labels = [
-            'hacktoberfest',
-            'hacktoberfest2025',
-            'hacktoberfest-accepted',
-            'hacktober',
-            'october'
-        ]
+        # Base query for Hacktoberfest 2025. Results are shared by every user, so a
+        # user's token must not bring in private repositories it can read
+        base_query = 'state:open type:issue archived:false is:public'
+        hacktoberfest_labels = self.HACKTOBERFEST_LABELS
         
         queries = []
         
@@ -93,10 +555,7 @@ class GitHubService:
                 ])
         
         # Add language filters from skills
-        programming_languages = [
-            'python', 'javascript', 'typescript', 'java', 'go', 'rust', 
-            'cpp', 'csharp', 'php', 'ruby', 'swift', 'kotlin', 'html', 'css'
-        ]
+        programming_languages = self.PROGRAMMING_LANGUAGES
         
         user_languages = []
         for skill in skills:
@@ -112,73 +571,329 @@ class GitHubService:
         
         # Create language-specific Hacktoberfest queries
         if user_languages:
-            for lang in user_languages[:3]:  # Top 3 languages
+            for lang in user_languages[:max_languages]:  # Top languages (3 for a profile search)
                 queries.append(f'{base_query} label:"hacktoberfest" language:{lang}')
                 if experience_level == 'beginner':
                     queries.append(f'{base_query} label:"hacktoberfest" label:"good first issue" language:{lang}')
         
         # Add topic-based queries for popular Hacktoberfest repositories
-        popular_hacktoberfest_topics = [
-            'web-development', 'machine-learning', 'python', 'javascript', 
-            'react', 'open-source', 'beginner-friendly', 'documentation'
-        ]
-        
-        for topic in popular_hacktoberfest_topics[:3]:
+        for topic in self.POPULAR_TOPICS[:max_topics]:
             queries.append(f'{base_query} label:"hacktoberfest" topic:{topic}')
         
-        return list(set(queries))[:8]  # Remove duplicates and limit
+        return list(dict.fromkeys(queries))
     
     def _search_issues(self, query: str, per_page: int = 25) -> List[Dict]:
         """Search GitHub issues using the Search API"""
         
+        return self._search_page(query, per_page=per_page)[0]
+    
+    def _search_page(self, query: str, per_page: int = 25, page: int = 1,
+                     refresh: bool = False, cache: bool = True) -> Tuple[List[Dict], Optional[bool]]:
+        """Fetch one page of search results, returning (issues, has_next_page)
+        
+        ``has_next_page`` is None when the page failed (rate limited, rejected
+        or errored), so callers can tell a failure from the last page.
+        ``refresh`` skips the shared issue cache (ETag revalidation still applies);
+        ``cache=False`` neither reads nor stores any cache.
+        """
+        
         url = f"{self.base_url}/search/issues"
         params = {
             'q': query,
             'sort': 'updated',
             'order': 'desc', 
-            'per_page': min(per_page, 100)  # GitHub max is 100
+            'per_page': min(per_page, 100),  # GitHub max is 100
+            'page': page
         }
         
-        response = requests.get(url, headers=self.headers, params=params)
+        cache_key = self._search_cache_key(query, params['per_page'], page)
+        fresh = None if refresh or not cache else self.issue_cache.get(cache_key)
+        if fresh is not None:
+            return self._copy_issues(fresh['issues']), fresh['has_next']
+        
+        cached = self.http_cache.get(url, params) if cache else None
+        response = self._request('GET', url, 'search', params=params, cache_entry=cached)
+        
+        if response is None:
+            st.error("🔒 GitHub API rate limit exceeded. Please add a GitHub token in the settings.")
+            return [], None
+        
+        if response.status_code == 304 and cached is not None:
+            self.http_cache.record(revalidated=True)
+            if cached.parsed is None:
+                cached.parsed = {
+                    'issues': self._parse_search_items(json.loads(cached.body).get('items', [])),
+                    'has_next': False
+                }
+            self.issue_cache.set(cache_key, cached.parsed)
+            return self._copy_issues(cached.parsed['issues']), cached.parsed['has_next']
         
         if response.status_code == 200:
+            self.http_cache.record(revalidated=False)
             data = response.json()
-            issues = []
-            
-            for item in data.get('items', []):
-                # Skip pull requests and focus on issues
-                if 'pull_request' not in item:
-                    formatted_issue = self._format_issue(item)
-                    if formatted_issue and self._is_hacktoberfest_issue(formatted_issue):
-                        issues.append(formatted_issue)
-            
-            return issues
+            result = {
+                'issues': self._parse_search_items(data.get('items', [])),
+                'has_next': 'next' in response.links
+            }
+            if cache:
+                self.http_cache.store(url, params, response, parsed=result)
+                self.issue_cache.set(cache_key, result)
+            return self._copy_issues(result['issues']), result['has_next']
             
-        elif response.status_code == 403:
+        elif response.status_code in (403, 429):
             st.error("🔒 GitHub API rate limit exceeded. Please add a GitHub token in the settings.")
-            return []
+            return [], None
         elif response.status_code == 422:
             st.warning("⚠️ Search query too complex. Trying simplified search...")
-            return []
+            return [], None
         else:
             st.warning(f"GitHub API returned status {response.status_code}")
-            return []
+            return [], None
     
-    def _is_hacktoberfest_issue(self, issue: Dict) -> bool:
-        """Check if issue is relevant for Hacktoberfest 2025"""
+    def _search_graphql(self, pending: List[Tuple[str, int, Optional[str]]],
+                        per_page: int, refresh: bool = False,
+                        cache: bool = True) -> Optional[List[Tuple[List[Dict], bool, Optional[str]]]]:
+        """Run every pending search as one aliased GraphQL query; None on failure"""
         
-        labels = [label.lower() for label in issue.get('labels', [])]
+        first = min(per_page, 100)
+        results: List[Optional[Tuple[List[Dict], bool, Optional[str]]]] = [None] * len(pending)
         
-        # Must have at least one Hacktoberfest-related label
-        hacktoberfest_keywords = [
-            'hacktoberfest', 'hacktoberfest2025', 'hacktoberfest-accepted',
-            'hacktober', 'october', 'good first issue', 'help wanted'
+        # Serve what we can from the shared cache, batch the rest into one request
+        to_fetch = []
+        for index, (query, page, cursor) in enumerate(pending):
+            fresh = None if refresh or not cache else self.issue_cache.get(self._graphql_cache_key(query, first, cursor))
+            if fresh is not None:
+                results[index] = (self._copy_issues(fresh['issues']), fresh['has_next'], fresh['cursor'])
+            else:
+                to_fetch.append(index)
+        
+        if to_fetch:
+            fields = []
+            variables = {'first': first}
+            declarations = ['$first: Int!']
+            for n, index in enumerate(to_fetch):
+                query, _, cursor = pending[index]
+                # GraphQL search has no sort argument, it goes in the query string
+                variables[f'q{n}'] = f'{query} sort:updated-desc'
+                variables[f'c{n}'] = cursor
+                declarations.extend([f'$q{n}: String!', f'$c{n}: String'])
+                fields.append(f'q{n}: search(query: $q{n}, type: ISSUE, first: $first, after: $c{n}) {{ ...SearchPage }}')
+            
+            body = {
+                'query': f"query({', '.join(declarations)}) {{\n  " + '\n  '.join(fields) + '\n}\n' + GRAPHQL_SEARCH_FRAGMENT,
+                'variables': variables
+            }
+            
+            try:
+                response = self._request('POST', f"{self.base_url}/graphql", 'graphql', json_body=body)
+            except Exception as e:
+                st.warning(f"GraphQL query failed: {str(e)}")
+                return None
+            
+            if response is None or response.status_code != 200:
+                return None
+            data = response.json().get('data')
+            if not data:
+                return None
+            
+            for n, index in enumerate(to_fetch):
+                query, _, cursor = pending[index]
+                search = data.get(f'q{n}') or {}
+                page_info = search.get('pageInfo') or {}
+                issues = self._parse_graphql_nodes(search.get('nodes') or [])
+                self.repo_metadata.remember(issues)
+                result = {
+                    'issues': issues,
+                    'has_next': bool(page_info.get('hasNextPage')),
+                    'cursor': page_info.get('endCursor')
+                }
+                if cache:
+                    self.issue_cache.set(self._graphql_cache_key(query, first, cursor), result)
+                results[index] = (self._copy_issues(result['issues']), result['has_next'], result['cursor'])
+        
+        return results
+    
+    def fetch_repository_metadata(self, full_names: List[str]) -> Dict[str, Dict]:
+        """Fetch stars, language, topics and archived status for many repositories"""
+        
+        if not full_names:
+            return {}
+        if self.backend == 'graphql':
+            metadata = self._fetch_repository_metadata_graphql(full_names)
+            if metadata is not None:
+                return metadata
+        
+        # REST costs one core request per repository: look up a few at once, none when quota is low
+        budget = self.token_pool.snapshot('core')['remaining'] - self.REST_REPO_LOOKUP_RESERVE
+        names = full_names[:max(0, min(self.MAX_REST_REPO_LOOKUPS, budget))]
+        if not names:
+            return {}
+        
+        def lookup(full_name):
+            response = self._request('GET', f"{self.base_url}/repos/{full_name}", 'core')
+            if response is None or response.status_code != 200:
+                return None
+            data = response.json()
+            return {
+                'stars': data.get('stargazers_count', 0),
+                'language': data.get('language'),
+                'topics': data.get('topics', []),
+                'archived': data.get('archived', False)
+            }
+        
+        return {full_name: repo for full_name, repo in zip(names, self._map_concurrently(lookup, names))
+                if repo is not None}
+    
+    def _fetch_repository_metadata_graphql(self, full_names: List[str]) -> Optional[Dict[str, Dict]]:
+        """Look up every repository in one aliased GraphQL query; None on failure"""
+        
+        declarations, fields, variables = [], [], {}
+        for n, full_name in enumerate(full_names):
+            owner, _, name = full_name.partition('/')
+            declarations.extend([f'$o{n}: String!', f'$n{n}: String!'])
+            fields.append(f'r{n}: repository(owner: $o{n}, name: $n{n}) {{ ...RepoMeta }}')
+            variables[f'o{n}'] = owner
+            variables[f'n{n}'] = name
+        
+        body = {
+            'query': f"query({', '.join(declarations)}) {{\n  " + '\n  '.join(fields) + '\n}\n' + GRAPHQL_REPO_FRAGMENT,
+            'variables': variables
+        }
+        response = self._request('POST', f"{self.base_url}/graphql", 'graphql', json_body=body)
+        if response is None or response.status_code != 200:
+            return None
+        
+        # Missing/renamed repositories come back as null alongside partial errors
+        data = response.json().get('data') or {}
+        metadata = {}
+        for n, full_name in enumerate(full_names):
+            repo = data.get(f'r{n}')
+            if repo:
+                metadata[full_name] = {
+                    'stars': repo.get('stargazerCount', 0),
+                    'language': (repo.get('primaryLanguage') or {}).get('name'),
+                    'topics': [t['topic']['name'] for t in (repo.get('repositoryTopics') or {}).get('nodes', []) if t],
+                    'archived': repo.get('isArchived', False)
+                }
+        return metadata
+    
+    def _graphql_cache_key(self, query: str, first: int, cursor: Optional[str]) -> str:
+        return f"graphql:{normalize_query(query)}:{first}:{cursor or ''}"
+    
+    def _parse_graphql_nodes(self, nodes: List[Dict]) -> List[Dict]:
+        """Format GraphQL issue nodes, keeping only Hacktoberfest issues"""
+        
+        issues = []
+        for node in nodes:
+            # Non-issue results come back as empty objects from the fragment
+            if not node or 'databaseId' not in node:
+                continue
+            formatted_issue = self._format_graphql_issue(node)
+            if formatted_issue and self._is_hacktoberfest_issue(formatted_issue):
+                issues.append(formatted_issue)
+        
+        return issues
+    
+    def _format_graphql_issue(self, node: Dict) -> Optional[Dict]:
+        """Format a GraphQL issue node like a REST item, with real repository metadata"""
+        
+        repo = node.get('repository') or {}
+        owner = (repo.get('owner') or {}).get('login', 'unknown')
+        assignees = [a['login'] for a in (node.get('assignees') or {}).get('nodes', []) if a]
+        
+        # Reshape into the REST search item layout so _format_issue stays the single formatter
+        formatted = self._format_issue({
+            'id': node['databaseId'],
+            'number': node['number'],
+            'title': node['title'],
+            'body': node.get('body', ''),
+            'html_url': node['url'],
+            'repository_url': f"{self.base_url}/repos/{owner}/{repo.get('name', 'unknown')}",
+            'labels': (node.get('labels') or {}).get('nodes', []),
+            'comments': (node.get('comments') or {}).get('totalCount', 0),
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+            'assignee': {'login': assignees[0]} if assignees else None,
+            'state': node.get('state', 'OPEN').lower()
+        })
+        if formatted is None:
+            return None
+        
+        repository = formatted['repository']
+        repository['stars'] = repo.get('stargazerCount', 0)
+        if repo.get('primaryLanguage'):
+            repository['language'] = repo['primaryLanguage']['name']
+        repository['topics'] = [
+            t['topic']['name'] for t in (repo.get('repositoryTopics') or {}).get('nodes', []) if t
         ]
+        repository['archived'] = repo.get('isArchived', False)
+        formatted['assignees'] = assignees
+        return formatted
+    
+    def _search_cache_key(self, query: str, per_page: int, page: int = 1) -> str:
+        return f"search:{normalize_query(query)}:{per_page}:{page}"
+    
+    def _parse_search_items(self, items: List[Dict]) -> List[Dict]:
+        """Format search API items, keeping only Hacktoberfest issues"""
         
-        has_hacktoberfest_label = any(
-            any(keyword in label for keyword in hacktoberfest_keywords)
-            for label in labels
-        )
+        issues = []
+        for item in items:
+            # Skip pull requests and focus on issues
+            if 'pull_request' not in item:
+                formatted_issue = self._format_issue(item)
+                if formatted_issue and self._is_hacktoberfest_issue(formatted_issue):
+                    issues.append(formatted_issue)
+        
+        return issues
+    
+    def _copy_issues(self, issues: List[Dict]) -> List[Issue]:
+        """Compact Issue records built from cached dicts, so callers can annotate them freely"""
+        
+        return [Issue.from_dict(issue) for issue in issues]
+    
+    def _request(self, method: str, url: str, resource: str, params: Optional[Dict] = None,
+                 json_body: Optional[Dict] = None, retries: int = 1,
+                 cache_entry=None) -> Optional[requests.Response]:
+        """Request paced by the shared rate limiter; None if quota won't free up in time"""
+        
+        headers = self.headers
+        if cache_entry is not None:
+            headers = {**self.headers, **cache_entry.conditional_headers()}
+        
+        for attempt in range(retries + 1):
+            # Least-loaded token each attempt, so a retry moves off an exhausted one
+            acquired = self.token_pool.acquire(resource, max_wait=self.MAX_RATE_LIMIT_WAIT)
+            if acquired is None:
+                return None
+            token, token_key = acquired
+            
+            response = self.session.request(method, url, headers=self._auth_headers(headers, token), params=params,
+                                            json=json_body, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 304:
+                # Conditional hits don't count against the quota
+                self.rate_limiter.refund(token_key, resource)
+            self.rate_limiter.update_from_headers(token_key, resource, response.headers)
+            
+            # Primary/secondary rate limits: retry once the limiter says the window reopened
+            rate_limited = response.status_code == 429 or (
+                response.status_code == 403 and (
+                    response.headers.get('X-RateLimit-Remaining') == '0'
+                    or 'Retry-After' in response.headers
+                )
+            )
+            if not rate_limited or attempt == retries:
+                return response
+        
+        return response
+    
+    def _auth_headers(self, headers: Dict, token: Optional[str]) -> Dict:
+        return {**headers, 'Authorization': f'token {token}'} if token else headers
+    
+    def _is_hacktoberfest_issue(self, issue: Dict) -> bool:
+        """Check if issue is relevant for Hacktoberfest 2025"""
+        
+        # Must have at least one Hacktoberfest-related label
+        has_hacktoberfest_label = label_classifier.classify(issue.get('labels', [])).is_hacktoberfest_related
         
         # Check if repository name suggests Hacktoberfest participation
         repo_name = issue.get('repository', {}).get('name', '').lower()
@@ -189,48 +904,52 @@ class GitHubService:
     def _prioritize_hacktoberfest_issues(self, issues: List[Dict]) -> List[Dict]:
         """Prioritize issues based on Hacktoberfest relevance"""
         
-        def hacktoberfest_score(issue):
-            score = 0
-            labels = [label.lower() for label in issue.get('labels', [])]
-            
+        # One reference "now" for the whole batch; timestamps were parsed at format time
+        now = time.time()
+        week_ago = now - 7 * 86400
+        month_ago = now - 30 * 86400
+        
+        scores = []
+        for issue in issues:
             # High priority labels
-            if any('hacktoberfest' in label for label in labels):
-                score += 10
-            if any('good first issue' in label for label in labels):
-                score += 8
-            if any('help wanted' in label for label in labels):
-                score += 6
-            if any('beginner' in label for label in labels):
-                score += 5
+            bits = label_classifier.classify(issue.get('labels', [])).bits
+            score = PRIORITY_LABEL_POINTS[bits & PRIORITY_LABEL_MASK]
             
             # Repository factors
-            repo_name = issue.get('repository', {}).get('name', '').lower()
-            if 'hacktoberfest' in repo_name or '2025' in repo_name:
+            if self._is_hacktoberfest_repo_name(issue.get('repository', {}).get('name', '')):
                 score += 7
             
             # Freshness factor (recent issues are better)
-            try:
-                from datetime import datetime, timezone
-                updated = datetime.fromisoformat(issue.get('updated_at', '').replace('Z', '+00:00'))
-                days_old = (datetime.now(timezone.utc) - updated).days
-                if days_old < 7:
+            updated = issue.get('updated_epoch')
+            if updated is None:
+                updated = self._parse_timestamp(issue.get('updated_at'))
+            if updated is not None:
+                if updated > week_ago:
                     score += 3
-                elif days_old < 30:
+                elif updated > month_ago:
                     score += 1
-            except:
-                pass
             
             # Activity factor (issues with some engagement)
-            comments = issue.get('comments', 0)
-            if 1 <= comments <= 5:  # Sweet spot - has attention but not overwhelming
+            if 1 <= issue.get('comments', 0) <= 5:  # Sweet spot - has attention but not overwhelming
                 score += 2
             
-            return score
+            scores.append(score)
         
-        # Sort by Hacktoberfest relevance
-        issues.sort(key=hacktoberfest_score, reverse=True)
+        # Sort by Hacktoberfest relevance (stable, like list.sort with reverse=True)
+        order = sorted(range(len(issues)), key=scores.__getitem__, reverse=True)
+        issues[:] = [issues[index] for index in order]
         return issues
     
+    def _parse_timestamp(self, value: Optional[str]) -> Optional[int]:
+        """GitHub ISO 8601 timestamp to epoch seconds, None if missing or malformed"""
+        
+        if not value:
+            return None
+        try:
+            return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+        except (TypeError, ValueError):
+            return None
+    
     def _format_issue(self, issue: Dict) -> Optional[Dict]:
         """Format GitHub issue data for display"""
         
@@ -245,6 +964,9 @@ class GitHubService:
             repo_owner = repo_parts[-2] if len(repo_parts) >= 2 else 'unknown'
             repo_name = repo_parts[-1] if len(repo_parts) >= 1 else 'unknown'
             
+            # Every label-derived feature in a single pass
+            features = label_classifier.classify(labels)
+            
             return {
                 'id': issue['id'],
                 'number': issue['number'],
@@ -255,61 +977,30 @@ class GitHubService:
                     'name': repo_name,
                     'owner': repo_owner,
                     'full_name': f"{repo_owner}/{repo_name}",
-                    'language': self._extract_language(labels, issue),
-                    'stars': 0,  # Would need separate API call for stars
-                    'is_hacktoberfest': self._check_hacktoberfest_repo(repo_name, labels)
+                    'language': features.language or 'Multiple',
+                    'stars': 0,  # Filled in by repository metadata enrichment
+                    'is_hacktoberfest': self._is_hacktoberfest_repo_name(repo_name) or features.has(HAS_HACKTOBERFEST)
                 },
                 'labels': labels,
                 'comments': issue.get('comments', 0),
                 'created_at': issue['created_at'],
                 'updated_at': issue['updated_at'],
+                'updated_epoch': self._parse_timestamp(issue['updated_at']),
                 'assignee': issue.get('assignee', {}).get('login') if issue.get('assignee') else None,
-                'difficulty': self._assess_difficulty(labels, issue.get('body', '')),
+                'difficulty': features.difficulty,
                 'state': issue.get('state', 'open'),
-                'hacktoberfest_score': self._calculate_hacktoberfest_score(labels, repo_name)
+                'hacktoberfest_score': self._hacktoberfest_score_from(features, repo_name)
             }
             
         except Exception as e:
             return None
     
-    def _check_hacktoberfest_repo(self, repo_name: str, labels: List[str]) -> bool:
-        """Check if repository is participating in Hacktoberfest"""
-        
-        repo_keywords = ['hacktoberfest', '2025']
-        label_keywords = ['hacktoberfest', 'hacktoberfest2025', 'hacktoberfest-accepted']
-        
-        repo_match = any(keyword in repo_name.lower() for keyword in repo_keywords)
-        label_match = any(keyword in label.lower() for label in labels for keyword in label_keywords)
-        
-        return repo_match or label_match
+    def _is_hacktoberfest_repo_name(self, repo_name: str) -> bool:
+        repo_name = repo_name.lower()
+        return 'hacktoberfest' in repo_name or '2025' in repo_name
     
-    def _calculate_hacktoberfest_score(self, labels: List[str], repo_name: str) -> int:
-        """Calculate how relevant this issue is for Hacktoberfest"""
-        
-        score = 0
-        labels_lower = [label.lower() for label in labels]
-        
-        # Direct Hacktoberfest labels
-        if any('hacktoberfest' in label for label in labels_lower):
-            score += 10
-        if 'hacktoberfest2025' in labels_lower:
-            score += 15
-        if 'hacktoberfest-accepted' in labels_lower:
-            score += 12
-        
-        # Beginner-friendly labels
-        if 'good first issue' in labels_lower:
-            score += 8
-        if any(term in labels_lower for term in ['beginner-friendly', 'easy', 'starter']):
-            score += 6
-        if 'first-timers-only' in labels_lower:
-            score += 7
-        
-        # General contribution labels
-        if 'help wanted' in labels_lower:
-            score += 5
-        if any(term in labels_lower for term in ['documentation', 'docs']):
-            score += 4
+    def _hacktoberfest_score_from(self, features, repo_name: str) -> int:
+        score = features.hacktoberfest_score
         
         # Repository name bonus
         if 'hacktoberfest' in repo_name.lower():
@@ -317,6 +1008,16 @@ class GitHubService:
         
         return min(score, 20)  # Cap at 20
     
+    def _check_hacktoberfest_repo(self, repo_name: str, labels: List[str]) -> bool:
+        """Check if repository is participating in Hacktoberfest"""
+        
+        return self._is_hacktoberfest_repo_name(repo_name) or label_classifier.classify(labels).has(HAS_HACKTOBERFEST)
+    
+    def _calculate_hacktoberfest_score(self, labels: List[str], repo_name: str) -> int:
+        """Calculate how relevant this issue is for Hacktoberfest"""
+        
+        return self._hacktoberfest_score_from(label_classifier.classify(labels), repo_name)
+    
     def _clean_body(self, body: str) -> str:
         """Clean and truncate issue body"""
         if not body:
@@ -338,57 +1039,12 @@ class GitHubService:
     def _extract_language(self, labels: List[str], issue: Dict) -> str:
         """Extract programming language from labels"""
         
-        # Language mapping from labels
-        language_indicators = {
-            'python': 'Python', 'javascript': 'JavaScript', 'typescript': 'TypeScript',
-            'java': 'Java', 'cpp': 'C++', 'c++': 'C++', 'csharp': 'C#', 'c#': 'C#',
-            'go': 'Go', 'rust': 'Rust', 'php': 'PHP', 'ruby': 'Ruby',
-            'swift': 'Swift', 'kotlin': 'Kotlin', 'html': 'HTML', 'css': 'CSS',
-            'react': 'JavaScript', 'vue': 'JavaScript', 'angular': 'TypeScript',
-            'node': 'JavaScript', 'django': 'Python', 'flask': 'Python'
-        }
-        
-        # Check labels first
-        for label in labels:
-            label_lower = label.lower()
-            for indicator, language in language_indicators.items():
-                if indicator in label_lower:
-                    return language
-        
-        return 'Multiple'  # Default when language is unclear
+        return label_classifier.classify(labels).language or 'Multiple'  # Default when language is unclear
     
     def _assess_difficulty(self, labels: List[str], body: str) -> str:
         """Assess issue difficulty from labels and content"""
         
-        label_text = ' '.join(labels).lower()
-        
-        # Easy indicators
-        easy_indicators = [
-            'good first issue', 'easy', 'beginner', 'starter', 'first-timers-only',
-            'newbie-friendly', 'low-hanging-fruit', 'simple', 'trivial'
-        ]
-        
-        # Hard indicators
-        hard_indicators = [
-            'expert', 'advanced', 'complex', 'difficult', 'breaking-change',
-            'architecture', 'performance', 'security', 'refactor', 'critical'
-        ]
-        
-        # Medium indicators
-        medium_indicators = [
-            'enhancement', 'feature', 'improvement', 'optimization'
-        ]
-        
-        # Check for difficulty indicators
-        if any(indicator in label_text for indicator in easy_indicators):
-            return 'easy'
-        elif any(indicator in label_text for indicator in hard_indicators):
-            return 'hard'
-        elif any(indicator in label_text for indicator in medium_indicators):
-            return 'medium'
-        else:
-            # Default to easy for Hacktoberfest to encourage participation
-            return 'easy'
+        return label_classifier.classify(labels).difficulty
     
     def _deduplicate_issues(self, issues: List[Dict]) -> List[Dict]:
         """Remove duplicate issues based on URL"""
@@ -404,8 +1060,22 @@ class GitHubService:
         
         return unique_issues
     
-    def _get_hacktoberfest_fallback_issues(self) -> List[Dict]:
-        """Provide fallback Hacktoberfest sample issues when API fails"""
+    def _get_hacktoberfest_fallback_issues(self, skills: Optional[List[str]] = None,
+                                           experience_level: Optional[str] = None,
+                                           max_results: int = 20) -> List[Dict]:
+        """Provide fallback Hacktoberfest sample issues when API fails
+        
+        Served from the binary issue snapshot when one is mapped, preferring
+        the profile's languages and difficulty.
+        """
+        
+        if self.issue_snapshot is not None and len(self.issue_snapshot):
+            difficulties = self.INDEX_DIFFICULTIES.get(experience_level)
+            issues = self.issue_snapshot.top(max_results, difficulties=difficulties, languages=skills or None)
+            if not issues:
+                issues = self.issue_snapshot.top(max_results, difficulties=difficulties)
+            if issues:
+                return self._prioritize_hacktoberfest_issues(issues)
         
         return [
             {
@@ -482,16 +1152,24 @@ class GitHubService:
     def check_rate_limit(self) -> Dict:
         """Check current GitHub API rate limit status"""
         
-        try:
-            response = requests.get(f"{self.base_url}/rate_limit", headers=self.headers)
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    'remaining': data['rate']['remaining'],
-                    'limit': data['rate']['limit'],
-                    'reset_time': data['rate']['reset']
-                }
-        except Exception:
-            pass
+        rates = []
+        for token, token_key in self.token_pool.tokens:
+            try:
+                response = self.session.get(f"{self.base_url}/rate_limit", headers=self._auth_headers(self.headers, token),
+                                            timeout=REQUEST_TIMEOUT)
+                if response.status_code == 200:
+                    data = response.json()
+                    self.rate_limiter.update_from_rate_limit(token_key, data.get('resources', {}))
+                    rates.append(data['rate'])
+            except Exception:
+                pass
+        
+        if rates:
+            # Summed over the token pool
+            return {
+                'remaining': sum(rate['remaining'] for rate in rates),
+                'limit': sum(rate['limit'] for rate in rates),
+                'reset_time': min(rate['reset'] for rate in rates)
+            }
         
         return {'remaining': 'unknown', 'limit': 'unknown', 'reset_time': 'unknown'}
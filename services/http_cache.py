@@ -0,0 +1,90 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class CacheEntry:
+    """Validators and payload of one cached GitHub response"""
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        # Result derived from body (e.g. formatted issues) so a 304 skips re-parsing
+        self.parsed: Any = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """LRU store of validator-bearing responses for conditional GitHub requests"""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict] = None) -> Tuple:
+        return (url, tuple(sorted((params or {}).items())))
+
+    def get(self, url: str, params: Optional[Dict] = None) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(self.key(url, params))
+            if entry is not None:
+                self._entries.move_to_end(self.key(url, params))
+            return entry
+
+    def store(self, url: str, params: Optional[Dict], response, parsed: Any = None) -> Optional[CacheEntry]:
+        """Remember a 200 response if GitHub sent a validator for it"""
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return None
+
+        entry = CacheEntry(etag, last_modified, response.content)
+        entry.parsed = parsed
+
+        with self._lock:
+            key = self.key(url, params)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def record(self, revalidated: bool):
+        """Count a 304 (hit) or a full fetch (miss)"""
+
+        with self._lock:
+            if revalidated:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / total if total else 0.0
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every GitHubService in the process
+http_cache = HTTPCache()
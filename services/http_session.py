@@ -0,0 +1,57 @@
+import threading
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Sized for the concurrent search fan-out of every Streamlit session in the process
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+# Connect / read timeouts in seconds for GitHub API calls
+REQUEST_TIMEOUT = (5, 20)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with pooled connections and transient-error retries"""
+
+    # 403/429 are left to the rate limiter, which knows how long to wait; urllib3
+    # would otherwise retry any 429 with Retry-After, sleeping outside the limiter
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=2,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD', 'POST']),
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+        pool_block=True
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Auth headers are passed per request, the session is shared between users
+    session.headers.update({'Connection': 'keep-alive'})
+    return session
+
+
+def get_session() -> requests.Session:
+    """Process-wide pooled session shared across Streamlit sessions"""
+
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Local full-text index of Hacktoberfest issues (SQLite FTS5).
+
+Filled by crawling the app's search query shapes, then queried by
+``GitHubService.fetch_issues(..., mode='index')`` without any GitHub
+request. Build or refresh it with ``python -m services.issue_index``;
+set ISSUE_INDEX_PATH so the app and the crawler share one file.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
+from services.issue_store import is_open_for_contribution
+from services.models import Issue
+
+
+class IssueIndex:
+    """Issues plus an FTS5 table over title, body, labels and repository.
+
+    ``available`` is False when this SQLite build lacks FTS5; callers then
+    fall back to live search.
+    """
+
+    # bm25 column weights: title, body, labels, repository (name, language, topics)
+    WEIGHTS = (3.0, 1.0, 2.0, 2.0)
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or ':memory:'
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+        if self.path != ':memory:':
+            self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS issues ('
+            'id INTEGER PRIMARY KEY, url TEXT UNIQUE NOT NULL, data TEXT NOT NULL, '
+            'difficulty TEXT, score INTEGER, updated_epoch INTEGER, indexed_at REAL NOT NULL)'
+        )
+        try:
+            # '+' and '#' are word characters so C++ and C# stay searchable
+            self._db.execute(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5('
+                'title, body, labels, repository, tokenize="unicode61 tokenchars \'+#\'")'
+            )
+            self.available = True
+        except sqlite3.OperationalError:
+            self.available = False
+        self._db.commit()
+
+    def add(self, issues: Iterable[Dict], indexed_at: Optional[float] = None) -> int:
+        """Insert or update issues; closed or assigned ones are removed instead"""
+
+        indexed_at = indexed_at or time.time()
+        added = 0
+        with self._lock:
+            for issue in issues:
+                if not is_open_for_contribution(issue):
+                    self._delete(issue['url'])
+                    continue
+                self._upsert(issue, indexed_at)
+                added += 1
+            self._db.commit()
+        return added
+
+    def search(self, terms: Sequence[str], difficulties: Optional[Sequence[str]] = None,
+               limit: int = 100) -> List[Issue]:
+        """Best matches for any of the terms (skills, interests), most relevant first.
+
+        Without terms, the highest Hacktoberfest scores are returned.
+        """
+
+        if not self.available:
+            return []
+
+        where, params = [], []
+        phrases = ['"' + term.strip().lower().replace('"', '""') + '"' for term in terms if term.strip()]
+        if phrases:
+            where.append('issues_fts MATCH ?')
+            params.append(' OR '.join(phrases))
+        if difficulties:
+            where.append(f"i.difficulty IN ({', '.join('?' * len(difficulties))})")
+            params.extend(difficulties)
+
+        order = ('bm25(issues_fts, ?, ?, ?, ?), i.score DESC' if phrases
+                 else 'i.score DESC, i.updated_epoch DESC')
+        sql = (
+            'SELECT i.data FROM issues_fts JOIN issues i ON i.id = issues_fts.rowid '
+            + (f"WHERE {' AND '.join(where)} " if where else '')
+            + f'ORDER BY {order} LIMIT ?'
+        )
+        params = params + (list(self.WEIGHTS) if phrases else []) + [limit]
+
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [Issue.from_dict(json.loads(row[0])) for row in rows]
+
+    def prune(self, before: float) -> int:
+        """Drop issues not seen by a crawl since ``before``"""
+
+        with self._lock:
+            ids = [row[0] for row in self._db.execute('SELECT id FROM issues WHERE indexed_at < ?', (before,))]
+            for issue_id in ids:
+                self._db.execute('DELETE FROM issues_fts WHERE rowid = ?', (issue_id,))
+                self._db.execute('DELETE FROM issues WHERE id = ?', (issue_id,))
+            self._db.commit()
+        return len(ids)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM issues').fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM issues')
+            if self.available:
+                self._db.execute('DELETE FROM issues_fts')
+            self._db.commit()
+
+    # Callers hold self._lock
+
+    def _delete(self, url: str):
+        row = self._db.execute('SELECT id FROM issues WHERE url = ?', (url,)).fetchone()
+        if row is not None:
+            if self.available:
+                self._db.execute('DELETE FROM issues_fts WHERE rowid = ?', (row[0],))
+            self._db.execute('DELETE FROM issues WHERE id = ?', (row[0],))
+
+    def _upsert(self, issue: Dict, indexed_at: float):
+        data = issue.to_dict() if isinstance(issue, Issue) else issue
+        values = (json.dumps(data, separators=(',', ':')), data.get('difficulty'),
+                  data.get('hacktoberfest_score', 0), data.get('updated_epoch'), indexed_at)
+
+        row = self._db.execute('SELECT id FROM issues WHERE url = ?', (data['url'],)).fetchone()
+        if row is None:
+            issue_id = self._db.execute(
+                'INSERT INTO issues (data, difficulty, score, updated_epoch, indexed_at, url) VALUES (?, ?, ?, ?, ?, ?)',
+                values + (data['url'],)
+            ).lastrowid
+        else:
+            issue_id = row[0]
+            self._db.execute(
+                'UPDATE issues SET data = ?, difficulty = ?, score = ?, updated_epoch = ?, indexed_at = ? WHERE id = ?',
+                values + (issue_id,)
+            )
+            if self.available:
+                self._db.execute('DELETE FROM issues_fts WHERE rowid = ?', (issue_id,))
+
+        if self.available:
+            repo = data.get('repository') or {}
+            repository = ' '.join([repo.get('full_name', ''), repo.get('language') or '',
+                                   *(topic.replace('-', ' ') for topic in repo.get('topics') or [])])
+            self._db.execute(
+                'INSERT INTO issues_fts (rowid, title, body, labels, repository) VALUES (?, ?, ?, ?, ?)',
+                (issue_id, data.get('title', ''), data.get('body', ''), ' '.join(data.get('labels') or []), repository)
+            )
+
+
+def crawl(index: IssueIndex, service, queries: Sequence[str], per_page: int = 100,
+          max_pages: int = 3, prune: bool = True, **options) -> Dict:
+    """Index every issue the queries return, up to max_pages each.
+
+    A thin wrapper around ``IssueCrawler`` without a snapshot or checkpoint;
+    ``options`` go to the crawler (retries, batch size, quota reserve).
+    """
+
+    from services.crawler import IssueCrawler
+
+    options.setdefault('quota_reserve', 0)
+    crawler = IssueCrawler(service, index=index, queries=queries, per_page=per_page,
+                           max_pages=max_pages, prune=prune, **options)
+    return crawler.run(fresh=True)
+
+
+# Shared by every session; on disk (and shared with the crawler) when ISSUE_INDEX_PATH is set
+issue_index = IssueIndex(os.getenv('ISSUE_INDEX_PATH') or None)
+
+
+def main():
+    from services.crawler import IssueCrawler
+    from services.github_service import GitHubService
+    from services.prefetch_worker import DEFAULT_LANGUAGES
+
+    parser = argparse.ArgumentParser(description="Crawl Hacktoberfest issues into the local search index")
+    parser.add_argument('--languages', default=','.join(DEFAULT_LANGUAGES),
+                        help="Comma-separated skills to crawl language queries for")
+    parser.add_argument('--max-pages', type=int, default=3, help="Result pages per query")
+    parser.add_argument('--no-prune', action='store_true', help="Keep issues this crawl did not see")
+    parser.add_argument('--fresh', action='store_true', help="Ignore any checkpoint and start over")
+    args = parser.parse_args()
+
+    index_path = os.getenv('ISSUE_INDEX_PATH')
+    if not index_path:
+        print("⚠️ ISSUE_INDEX_PATH is not set, the index is discarded when this process exits")
+    if not issue_index.available:
+        print("❌ This SQLite build has no FTS5 support")
+        return
+
+    service = GitHubService(token=os.getenv('GITHUB_TOKEN') or None)
+    languages = [language.strip() for language in args.languages.split(',') if language.strip()]
+    queries = service.query_shapes(languages)
+    print(f"Crawling {len(queries)} query shapes...")
+    crawler = IssueCrawler(service, index=issue_index, queries=queries, max_pages=args.max_pages,
+                           prune=not args.no_prune,
+                           checkpoint_path=index_path + '.checkpoint.json' if index_path else None)
+    stats = crawler.run(fresh=args.fresh)
+    if stats['remaining']:
+        print(f"⚠️ {stats['remaining']} queries left to crawl ({stats['failed']} failed), skipped pruning")
+    print(f"✅ Indexed {stats['issues']} issues, pruned {stats['pruned']} ({issue_index.count()} total)")
+
+
+if __name__ == "__main__":
+    main()
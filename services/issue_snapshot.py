@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Binary issue snapshot: a fixed-width record table plus a deduplicated string pool.
+
+The file is memory-mapped read-only, so every Streamlit worker process on
+a host shares one page-cached copy and nothing is parsed up front; filters
+run over the numeric record fields and strings are only decoded for the
+issues actually returned. Build one from a crawler snapshot with
+
+    python -m services.issue_snapshot hacktoberfest_issues.jsonl.gz issues.bin
+
+and point ISSUE_BINARY_SNAPSHOT_PATH at it.
+"""
+
+import argparse
+import heapq
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from services.label_classifier import label_classifier
+from services.models import Issue
+
+MAGIC = b'HFIS'
+VERSION = 1
+
+# magic, version, record size, record count, string pool offset
+HEADER = struct.Struct('<4sHHIQ')
+
+# id, number, comments, stars, updated_epoch, label feature bits, hacktoberfest score,
+# difficulty code, flags, then (offset, length) pool references for STRING_FIELDS
+RECORD = struct.Struct('<qiiiqIhBB' + 'II' * 9)
+STRING_FIELDS = ('title', 'body', 'url', 'full_name', 'language', 'labels', 'topics', 'created_at', 'updated_at')
+_FIRST_STRING = 9  # Index of the first pool reference in an unpacked record
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+_UNKNOWN_DIFFICULTY = 255
+FLAG_HACKTOBERFEST_REPO = 1 << 0
+FLAG_ARCHIVED = 1 << 1
+
+_SEPARATOR = '\x1f'  # Joins labels and topics into one pooled string
+
+
+def write_snapshot(path: str, issues: Iterable[Dict]) -> int:
+    """Write issues to a binary snapshot, returning the record count.
+
+    The file is replaced atomically, so processes that mapped the previous
+    version keep reading it until they reopen.
+    """
+
+    pool = bytearray()
+    pooled: Dict[str, Tuple[int, int]] = {}
+
+    def ref(value: str) -> Tuple[int, int]:
+        if value not in pooled:
+            encoded = value.encode('utf-8')
+            pooled[value] = (len(pool), len(encoded))
+            pool.extend(encoded)
+        return pooled[value]
+
+    records = bytearray()
+    count = 0
+    for issue in issues:
+        repo = issue.get('repository') or {}
+        labels = list(issue.get('labels') or [])
+        difficulty = issue.get('difficulty')
+        flags = ((FLAG_HACKTOBERFEST_REPO if repo.get('is_hacktoberfest') else 0) |
+                 (FLAG_ARCHIVED if repo.get('archived') else 0))
+        strings = (
+            issue.get('title', ''), issue.get('body') or '', issue['url'], repo.get('full_name', ''),
+            repo.get('language') or '', _SEPARATOR.join(labels), _SEPARATOR.join(repo.get('topics') or []),
+            issue.get('created_at') or '', issue.get('updated_at') or ''
+        )
+        refs = [part for value in strings for part in ref(value)]
+        records.extend(RECORD.pack(
+            issue.get('id') or 0, issue.get('number') or 0, issue.get('comments') or 0,
+            repo.get('stars') or 0, issue.get('updated_epoch') or 0,
+            label_classifier.classify(labels).bits, issue.get('hacktoberfest_score') or 0,
+            DIFFICULTIES.index(difficulty) if difficulty in DIFFICULTIES else _UNKNOWN_DIFFICULTY,
+            flags, *refs
+        ))
+        count += 1
+
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count, HEADER.size + len(records)))
+        f.write(records)
+        f.write(pool)
+    os.replace(temp_path, path)
+    return count
+
+
+class IssueSnapshot:
+    """Read-only, memory-mapped view of a binary issue snapshot"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            # The mapping stays valid after the file object is closed
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, record_size, count, pool_offset = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a version {VERSION} issue snapshot")
+
+        self._count = count
+        self._pool = pool_offset
+        self._records = memoryview(self._buffer)[HEADER.size:pool_offset]
+        self._short_strings: Dict[int, str] = {}  # Languages repeat, decode each once
+
+    def __len__(self) -> int:
+        return self._count
+
+    def issue(self, index: int) -> Issue:
+        return self._issue(RECORD.unpack_from(self._records, index * RECORD.size))
+
+    def filter(self, difficulties: Optional[Sequence[str]] = None,
+               languages: Optional[Iterable[str]] = None, label_bits: int = 0,
+               min_score: int = 0, include_archived: bool = False) -> Iterator[int]:
+        """Indices of records matching every given filter, read straight from the mapping
+
+        ``label_bits`` requires any of the label_classifier flags;
+        ``languages`` match case-insensitively.
+        """
+
+        codes = {DIFFICULTIES.index(d) for d in difficulties if d in DIFFICULTIES} if difficulties else None
+        wanted = {language.lower() for language in languages} if languages else None
+        language_ref = _FIRST_STRING + 2 * STRING_FIELDS.index('language')
+
+        for index, record in enumerate(RECORD.iter_unpack(self._records)):
+            if record[6] < min_score:
+                continue
+            if codes is not None and record[7] not in codes:
+                continue
+            if label_bits and not record[5] & label_bits:
+                continue
+            if not include_archived and record[8] & FLAG_ARCHIVED:
+                continue
+            if wanted is not None and self._short_string(*record[language_ref:language_ref + 2]).lower() not in wanted:
+                continue
+            yield index
+
+    def top(self, limit: int = 20, **filters) -> List[Issue]:
+        """Best matching issues by Hacktoberfest score, then most recently updated"""
+
+        best = heapq.nlargest(limit, self.filter(**filters), key=self._rank_key)
+        return [self.issue(index) for index in best]
+
+    def close(self):
+        self._records.release()
+        self._buffer.close()
+
+    def _rank_key(self, index: int) -> Tuple[int, int]:
+        record = RECORD.unpack_from(self._records, index * RECORD.size)
+        return record[6], record[4]
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._pool + offset
+        return self._buffer[start:start + length].decode('utf-8')
+
+    def _short_string(self, offset: int, length: int) -> str:
+        value = self._short_strings.get(offset)
+        if value is None:
+            value = self._short_strings[offset] = self._string(offset, length)
+        return value
+
+    def _issue(self, record: tuple) -> Issue:
+        strings = {
+            field: self._string(record[_FIRST_STRING + 2 * n], record[_FIRST_STRING + 2 * n + 1])
+            for n, field in enumerate(STRING_FIELDS)
+        }
+        owner, _, name = strings['full_name'].partition('/')
+        return Issue(
+            id=record[0],
+            number=record[1],
+            title=strings['title'],
+            body=strings['body'],
+            url=strings['url'],
+            repository={
+                'name': name,
+                'owner': owner,
+                'full_name': strings['full_name'],
+                'language': strings['language'] or 'Multiple',
+                'stars': record[3],
+                'is_hacktoberfest': bool(record[8] & FLAG_HACKTOBERFEST_REPO),
+                'topics': strings['topics'].split(_SEPARATOR) if strings['topics'] else [],
+                'archived': bool(record[8] & FLAG_ARCHIVED)
+            },
+            labels=strings['labels'].split(_SEPARATOR) if strings['labels'] else [],
+            comments=record[2],
+            created_at=strings['created_at'],
+            updated_at=strings['updated_at'],
+            updated_epoch=record[4] or None,
+            assignee=None,
+            difficulty=DIFFICULTIES[record[7]] if record[7] < len(DIFFICULTIES) else 'easy',
+            state='open',
+            hacktoberfest_score=record[6]
+        )
+
+
+def open_snapshot(path: Optional[str]) -> Optional[IssueSnapshot]:
+    """Map a snapshot if the path is set and valid, else None"""
+
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return IssueSnapshot(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"⚠️ Ignoring issue snapshot {path}: {e}")
+        return None
+
+
+# Mapped once per process; the OS shares the pages between processes
+issue_snapshot = open_snapshot(os.getenv('ISSUE_BINARY_SNAPSHOT_PATH'))
+
+
+def main():
+    from services.crawler import load_snapshot
+    from services.issue_store import is_open_for_contribution
+
+    parser = argparse.ArgumentParser(description="Convert a crawler JSONL snapshot to the binary format")
+    parser.add_argument('source', help="Crawler snapshot (.jsonl or .jsonl.gz)")
+    parser.add_argument('output', help="Binary snapshot to write")
+    args = parser.parse_args()
+
+    count = write_snapshot(args.output, (issue for issue in load_snapshot(args.source)
+                                         if is_open_for_contribution(issue)))
+    print(f"✅ Wrote {count} issues ({os.path.getsize(args.output) / 1024:.0f} KiB) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
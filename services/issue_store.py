@@ -0,0 +1,135 @@
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+from services.models import Issue
+from services.result_cache import ResultCache, normalize_query
+
+
+def is_open_for_contribution(issue: Dict) -> bool:
+    """Still worth recommending: open and nobody has picked it up"""
+
+    return issue.get('state', 'open') == 'open' and not issue.get('assignee') and not issue.get('assignees')
+
+
+def _plain(issue: Dict) -> Dict:
+    return issue.to_dict() if isinstance(issue, Issue) else issue
+
+
+def latest_update(issues: Iterable[Dict], since: Optional[str] = None) -> Optional[str]:
+    """Newest updated_at among the issues (ISO 8601 UTC strings sort chronologically)"""
+
+    for issue in issues:
+        updated_at = issue.get('updated_at')
+        if updated_at and (since is None or updated_at > since):
+            since = updated_at
+    return since
+
+
+class IssueStore:
+    """Locally synced search results per query, kept current with delta searches.
+
+    Each entry holds the issues a query returned, the newest ``updated_at``
+    seen (the high-water mark for the next ``updated:>=`` search) and the
+    paging state of the original full search. Entries live for ``max_age``,
+    after which the next sync re-runs the full search so issues that stopped
+    matching (e.g. a label was removed) drop out.
+    """
+
+    def __init__(self, max_age: float = 24 * 3600, max_issues: int = 300,
+                 cache: Optional[ResultCache] = None):
+        self.max_age = max_age
+        self.max_issues = max_issues
+        self.cache = cache or ResultCache(ttl=max_age, max_bytes=32 * 1024 * 1024, table='issue_sync')
+
+    @staticmethod
+    def _key(backend: str, query: str) -> str:
+        return f"sync:{backend}:{normalize_query(query)}"
+
+    def get(self, backend: str, query: str) -> Optional[Dict]:
+        return self.cache.get(self._key(backend, query))
+
+    def replace(self, backend: str, query: str, issues: List[Dict], per_page: int,
+                has_next: bool = False, cursor: Optional[str] = None) -> Dict:
+        """Start over from a full search's first page"""
+
+        entry = {
+            'issues': [_plain(issue) for issue in issues if is_open_for_contribution(issue)][:self.max_issues],
+            'high_water': latest_update(issues),
+            'per_page': per_page,
+            'pages': 1,
+            'has_next': has_next,
+            'cursor': cursor,
+            'created_at': time.time(),
+            'synced_at': time.time()
+        }
+        self.cache.set(self._key(backend, query), entry, ttl=self.max_age)
+        return entry
+
+    def extend(self, backend: str, query: str, issues: List[Dict], page: int,
+               has_next: Optional[bool], cursor: Optional[str] = None):
+        """Append the next result page of the full search, if it is the next one.
+
+        Failed pages (``has_next`` None) are skipped, so the entry still ends
+        where the next crawl has to pick up.
+        """
+
+        entry = self.get(backend, query)
+        if has_next is None or entry is None or entry.get('pages') != page - 1:
+            return
+        known = {issue['url'] for issue in entry['issues']}
+        added = [_plain(issue) for issue in issues
+                 if issue['url'] not in known and is_open_for_contribution(issue)]
+        entry.update(
+            issues=(entry['issues'] + added)[:self.max_issues],
+            high_water=latest_update(issues, entry.get('high_water')),
+            pages=page,
+            has_next=has_next,
+            cursor=cursor
+        )
+        self._save(backend, query, entry)
+
+    def merge(self, backend: str, query: str, entry: Dict, changed: List[Dict]) -> Dict:
+        """Apply issues changed since the entry's high-water mark.
+
+        Changed issues replace their stored copy; ones that were closed or
+        assigned are removed. The result stays most-recently-updated first,
+        like the search it stands in for.
+        """
+
+        by_url = {issue['url']: issue for issue in entry['issues']}
+        for issue in changed:
+            if is_open_for_contribution(issue):
+                by_url[issue['url']] = _plain(issue)
+            else:
+                by_url.pop(issue['url'], None)
+
+        issues = sorted(by_url.values(), key=lambda issue: issue.get('updated_at') or '', reverse=True)
+        entry = dict(
+            entry,
+            issues=issues[:self.max_issues],
+            high_water=latest_update(changed, entry.get('high_water')),
+            synced_at=time.time()
+        )
+        self._save(backend, query, entry)
+        return entry
+
+    def _save(self, backend: str, query: str, entry: Dict):
+        # Updates never extend an entry's life past max_age from its full search
+        remaining = entry['created_at'] + self.max_age - time.time()
+        if remaining > 0:
+            self.cache.set(self._key(backend, query), entry, ttl=remaining)
+
+    def clear(self):
+        self.cache.clear()
+
+
+# Synced search results shared by every session, on disk when ISSUE_CACHE_PATH is set
+issue_store = IssueStore(
+    max_age=float(os.getenv('ISSUE_SYNC_MAX_AGE', str(24 * 3600))),
+    cache=ResultCache(
+        ttl=float(os.getenv('ISSUE_SYNC_MAX_AGE', str(24 * 3600))),
+        max_bytes=32 * 1024 * 1024,
+        path=os.getenv('ISSUE_CACHE_PATH') or None,
+        table='issue_sync'
+    )
+)
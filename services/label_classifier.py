@@ -0,0 +1,202 @@
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Feature bits, OR-ed across an issue's labels
+HACKTOBERFEST_RELATED = 1 << 0   # any keyword _is_hacktoberfest_issue accepts
+HAS_HACKTOBERFEST = 1 << 1       # 'hacktoberfest' anywhere in a label
+HAS_GOOD_FIRST_ISSUE = 1 << 2
+HAS_HELP_WANTED = 1 << 3
+HAS_BEGINNER = 1 << 4
+EASY = 1 << 5
+HARD = 1 << 6
+MEDIUM = 1 << 7
+IS_HACKTOBERFEST_2025 = 1 << 8   # exact label matches from here on
+IS_HACKTOBERFEST_ACCEPTED = 1 << 9
+IS_GOOD_FIRST_ISSUE = 1 << 10
+IS_BEGINNER_TERM = 1 << 11
+IS_FIRST_TIMERS_ONLY = 1 << 12
+IS_HELP_WANTED = 1 << 13
+IS_DOCS = 1 << 14
+
+# Substring keywords and the bits they set
+SUBSTRING_FEATURES = {
+    'hacktoberfest': HACKTOBERFEST_RELATED | HAS_HACKTOBERFEST,
+    'hacktober': HACKTOBERFEST_RELATED,
+    'october': HACKTOBERFEST_RELATED,
+    'good first issue': HACKTOBERFEST_RELATED | HAS_GOOD_FIRST_ISSUE | EASY,
+    'help wanted': HACKTOBERFEST_RELATED | HAS_HELP_WANTED,
+    'beginner': HAS_BEGINNER | EASY,
+    'easy': EASY, 'starter': EASY, 'first-timers-only': EASY, 'newbie-friendly': EASY,
+    'low-hanging-fruit': EASY, 'simple': EASY, 'trivial': EASY,
+    'expert': HARD, 'advanced': HARD, 'complex': HARD, 'difficult': HARD,
+    'breaking-change': HARD, 'architecture': HARD, 'performance': HARD,
+    'security': HARD, 'refactor': HARD, 'critical': HARD,
+    'enhancement': MEDIUM, 'feature': MEDIUM, 'improvement': MEDIUM, 'optimization': MEDIUM,
+}
+
+# Whole-label matches used by the Hacktoberfest score
+EXACT_FEATURES = {
+    'hacktoberfest2025': IS_HACKTOBERFEST_2025,
+    'hacktoberfest-accepted': IS_HACKTOBERFEST_ACCEPTED,
+    'good first issue': IS_GOOD_FIRST_ISSUE,
+    'beginner-friendly': IS_BEGINNER_TERM, 'easy': IS_BEGINNER_TERM, 'starter': IS_BEGINNER_TERM,
+    'first-timers-only': IS_FIRST_TIMERS_ONLY,
+    'help wanted': IS_HELP_WANTED,
+    'documentation': IS_DOCS, 'docs': IS_DOCS,
+}
+
+# Label substring -> language; earlier entries win when several match one label
+LANGUAGE_INDICATORS = [
+    ('python', 'Python'), ('javascript', 'JavaScript'), ('typescript', 'TypeScript'),
+    ('java', 'Java'), ('cpp', 'C++'), ('c++', 'C++'), ('csharp', 'C#'), ('c#', 'C#'),
+    ('go', 'Go'), ('rust', 'Rust'), ('php', 'PHP'), ('ruby', 'Ruby'),
+    ('swift', 'Swift'), ('kotlin', 'Kotlin'), ('html', 'HTML'), ('css', 'CSS'),
+    ('react', 'JavaScript'), ('vue', 'JavaScript'), ('angular', 'TypeScript'),
+    ('node', 'JavaScript'), ('django', 'Python'), ('flask', 'Python')
+]
+
+_NO_LANGUAGE = len(LANGUAGE_INDICATORS)
+
+
+class _Automaton:
+    """Aho-Corasick matcher reporting every (overlapping) keyword in one pass"""
+
+    def __init__(self, keywords: Dict[str, Tuple[int, int]]):
+        # Per node: transitions, failure link, OR-ed feature bits, best language rank
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.bits: List[int] = [0]
+        self.rank: List[int] = [_NO_LANGUAGE]
+
+        for keyword, (bits, rank) in keywords.items():
+            node = 0
+            for char in keyword:
+                if char not in self.goto[node]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.bits.append(0)
+                    self.rank.append(_NO_LANGUAGE)
+                    self.goto[node][char] = len(self.goto) - 1
+                node = self.goto[node][char]
+            self.bits[node] |= bits
+            self.rank[node] = min(self.rank[node], rank)
+
+        # Breadth-first failure links; outputs inherit from their failure node
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.bits[child] |= self.bits[self.fail[child]]
+                self.rank[child] = min(self.rank[child], self.rank[self.fail[child]])
+                queue.append(child)
+
+    def scan(self, text: str) -> Tuple[int, int]:
+        node, bits, rank = 0, 0, _NO_LANGUAGE
+        goto, fail = self.goto, self.fail
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            bits |= self.bits[node]
+            if self.rank[node] < rank:
+                rank = self.rank[node]
+        return bits, rank
+
+
+class LabelFeatures:
+    """Every label-derived feature of one issue"""
+
+    __slots__ = ('bits', 'language')
+
+    def __init__(self, bits: int, language: Optional[str]):
+        self.bits = bits
+        self.language = language
+
+    def has(self, flag: int) -> bool:
+        return bool(self.bits & flag)
+
+    @property
+    def is_hacktoberfest_related(self) -> bool:
+        return self.has(HACKTOBERFEST_RELATED)
+
+    @property
+    def difficulty(self) -> str:
+        if self.has(EASY):
+            return 'easy'
+        elif self.has(HARD):
+            return 'hard'
+        elif self.has(MEDIUM):
+            return 'medium'
+        # Default to easy for Hacktoberfest to encourage participation
+        return 'easy'
+
+    @property
+    def hacktoberfest_score(self) -> int:
+        """Label part of GitHubService._calculate_hacktoberfest_score (before the cap)"""
+
+        score = 0
+        for flag, points in _SCORE_POINTS:
+            if self.bits & flag:
+                score += points
+        return score
+
+
+_SCORE_POINTS = (
+    (HAS_HACKTOBERFEST, 10), (IS_HACKTOBERFEST_2025, 15), (IS_HACKTOBERFEST_ACCEPTED, 12),
+    (IS_GOOD_FIRST_ISSUE, 8), (IS_BEGINNER_TERM, 6), (IS_FIRST_TIMERS_ONLY, 7),
+    (IS_HELP_WANTED, 5), (IS_DOCS, 4),
+)
+
+
+class LabelClassifier:
+    """Classifies issue labels in one pass with a memo per distinct label string"""
+
+    def __init__(self, max_memo: int = 50000):
+        keywords: Dict[str, Tuple[int, int]] = {}
+        for keyword, bits in SUBSTRING_FEATURES.items():
+            keywords[keyword] = (bits, _NO_LANGUAGE)
+        for rank, (indicator, _) in enumerate(LANGUAGE_INDICATORS):
+            bits, best = keywords.get(indicator, (0, _NO_LANGUAGE))
+            keywords[indicator] = (bits, min(best, rank))
+
+        self._automaton = _Automaton(keywords)
+        self._memo: Dict[str, Tuple[int, int]] = {}
+        self._max_memo = max_memo
+        self._lock = threading.Lock()
+
+    def label(self, label: str) -> Tuple[int, int]:
+        """(feature bits, language rank) for a single label, memoised"""
+
+        cached = self._memo.get(label)
+        if cached is not None:
+            return cached
+
+        lowered = label.lower()
+        bits, rank = self._automaton.scan(lowered)
+        bits |= EXACT_FEATURES.get(lowered, 0)
+
+        with self._lock:
+            if len(self._memo) >= self._max_memo:
+                self._memo.clear()  # Label vocabularies are small, a reset is rare and cheap
+            self._memo[label] = (bits, rank)
+        return bits, rank
+
+    def classify(self, labels: Iterable[str]) -> LabelFeatures:
+        bits = 0
+        language = None
+        for label in labels:
+            label_bits, rank = self.label(label)
+            bits |= label_bits
+            # The first label naming a language decides it
+            if language is None and rank != _NO_LANGUAGE:
+                language = LANGUAGE_INDICATORS[rank][1]
+        return LabelFeatures(bits, language)
+
+
+# Shared, read-mostly: the automaton is immutable and the memo only grows
+label_classifier = LabelClassifier()
@@ -0,0 +1,134 @@
+import sys
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional
+
+
+class _Record(MutableMapping):
+    """Slotted record that still reads and writes like the dicts it replaces.
+
+    Known fields live in slots; any other key goes to a small overflow dict
+    that is only created when needed. Unset fields behave like missing keys,
+    so ``issue.get('ai_score', 0)`` keeps working.
+    """
+
+    __slots__ = ('_extra',)
+    _fields: tuple = ()
+
+    def __init__(self, data: Optional[Dict] = None, **fields):
+        self._extra = None
+        for key, value in {**(data or {}), **fields}.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._fields:
+            setattr(self, key, self._convert(key, value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._fields:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._fields:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict):
+        self._extra = None
+        for key, value in state.items():
+            self[key] = value
+
+    def _convert(self, key: str, value: Any) -> Any:
+        return value
+
+    def copy(self):
+        """Shallow copy, like dict.copy (nested records are shared)"""
+        return type(self)(dict(self.items()))
+
+    def to_dict(self) -> Dict:
+        return {key: value.to_dict() if isinstance(value, _Record) else value
+                for key, value in self.items()}
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Repository(_Record):
+    """Repository fields shown with an issue"""
+
+    __slots__ = ('name', 'owner', 'full_name', 'language', 'stars', 'is_hacktoberfest', 'topics', 'archived')
+    _fields = __slots__
+
+    def _convert(self, key: str, value: Any) -> Any:
+        if key == 'topics' and value is not None:
+            return tuple(_intern(topic) for topic in value)
+        # Owners and languages repeat across many issues
+        if key in ('owner', 'language'):
+            return _intern(value)
+        return value
+
+
+class Issue(_Record):
+    """A formatted GitHub issue plus the AI annotations added later"""
+
+    __slots__ = (
+        'id', 'number', 'title', 'body', 'url', 'repository', 'labels', 'comments',
+        'created_at', 'updated_at', 'updated_epoch', 'assignee', 'assignees', 'difficulty',
+        'state', 'hacktoberfest_score', 'ai_score', 'ai_summary', 'estimated_time',
+        'learning_opportunity', 'ai_pending'
+    )
+    _fields = __slots__
+
+    def _convert(self, key: str, value: Any) -> Any:
+        if key == 'repository' and isinstance(value, dict):
+            return Repository(value)
+        if key == 'labels' and value is not None:
+            # A small vocabulary shared by thousands of issues
+            return tuple(_intern(label) for label in value)
+        if key in ('difficulty', 'state', 'learning_opportunity', 'estimated_time'):
+            return _intern(value)
+        return value
+
+    def copy(self) -> 'Issue':
+        copied = super().copy()
+        if isinstance(self.get('repository'), Repository):
+            # The old dict.copy shared the nested dict; a copy here keeps per-user edits apart
+            copied['repository'] = self['repository'].copy()
+        return copied
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Issue':
+        """New Issue (and Repository) from a formatted issue dict"""
+        return cls(data)
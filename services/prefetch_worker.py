@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Background prefetcher that keeps popular search query shapes warm in the issue cache.
+
+Run inside the app (see PREFETCH_ISSUES in streamlit_app.py) or as its own
+process with ``python -m services.prefetch_worker``; a separate process only
+helps the app when both share an on-disk cache via ISSUE_CACHE_PATH.
+"""
+
+import argparse
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+from services.github_service import GitHubService
+
+# Skill sets whose language-specific queries are worth keeping warm
+DEFAULT_LANGUAGES = ('Python', 'JavaScript', 'TypeScript', 'Java', 'Go')
+
+# Search targets worth keeping warm: the Find Issues page's default "Max Issues"
+DEFAULT_MAX_RESULTS = (5,)
+
+
+class PrefetchWorker:
+    """Re-fetches query shapes shortly before their cached results expire"""
+
+    def __init__(self, service: Optional[GitHubService] = None,
+                 languages: Sequence[str] = DEFAULT_LANGUAGES,
+                 max_results: Sequence[int] = DEFAULT_MAX_RESULTS,
+                 refresh_margin: float = 120, interval: float = 60,
+                 quota_reserve: int = 10):
+        self.service = service or GitHubService(token=os.getenv('GITHUB_TOKEN') or None)
+        self.languages = list(languages)
+        # Warm the page sizes those searches actually request, so their cache keys match
+        self.page_sizes = sorted({size for target in max_results for size in self.service.page_sizes(target)})
+        self.refresh_margin = refresh_margin  # Refresh when less than this many seconds are left
+        self.interval = interval
+        self.quota_reserve = quota_reserve  # Search requests always left for interactive users
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def query_shapes(self) -> List[str]:
+        """Every distinct query the app builds for the common profiles"""
+
+        return self.service.query_shapes(self.languages)
+
+    def _quota_left(self) -> int:
+        resource = 'graphql' if self.service.backend == 'graphql' else 'search'
+        return self.service.token_pool.snapshot(resource)['remaining']
+
+    def run_once(self) -> Dict:
+        """Warm every shape that is missing or about to expire"""
+
+        stats = {'checked': 0, 'refreshed': 0, 'issues': 0, 'skipped_for_quota': 0}
+        for per_page in self.page_sizes:
+            due = []
+            for query in self.query_shapes():
+                stats['checked'] += 1
+                expires_in = self.service.cached_for(query, per_page)
+                if expires_in is None or expires_in < self.refresh_margin:
+                    due.append(query)
+
+            # Small batches: one GraphQL request each, or a few REST searches
+            for start in range(0, len(due), 4):
+                if self._stop.is_set():
+                    return stats
+                batch = due[start:start + 4]
+                if self._quota_left() - len(batch) < self.quota_reserve:
+                    stats['skipped_for_quota'] += len(due) - start
+                    break
+                stats['issues'] += self.service.warm_queries(batch, per_page)
+                stats['refreshed'] += len(batch)
+
+        return stats
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"Prefetch pass failed: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self) -> 'PrefetchWorker':
+        """Run in a daemon thread of the current process"""
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run_forever, name='issue-prefetch', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep popular Hacktoberfest searches warm in the issue cache")
+    parser.add_argument('--once', action='store_true', help="Run a single warm-up pass and exit")
+    parser.add_argument('--interval', type=float, default=60, help="Seconds between passes")
+    parser.add_argument('--languages', default=','.join(DEFAULT_LANGUAGES),
+                        help="Comma-separated skills to warm language queries for")
+    args = parser.parse_args()
+
+    if not os.getenv('ISSUE_CACHE_PATH'):
+        print("⚠️ ISSUE_CACHE_PATH is not set, warmed results stay in this process only")
+
+    worker = PrefetchWorker(
+        languages=[language.strip() for language in args.languages.split(',') if language.strip()],
+        interval=args.interval
+    )
+
+    if args.once:
+        print(f"Prefetch pass: {worker.run_once()}")
+        return
+
+    print(f"Warming {len(worker.query_shapes())} query shapes every {args.interval:.0f}s (Ctrl+C to stop)")
+    try:
+        while True:
+            stats = worker.run_once()
+            print(f"Prefetch pass: {stats}")
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        worker.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import hashlib
 import json
 from typing import Dict, Optional
 import streamlit as st
@@ -47,6 +48,19 @@ class ProfileService:
         
         return labels
     
+    @staticmethod
+    def get_profile_fingerprint(profile: Dict) -> str:
+        """Stable hash of the profile fields that affect issue recommendations"""
+        
+        normalized = {
+            'experience_level': profile.get('experience_level', ''),
+            # Order matters: only the leading skills/interests reach the AI prompt
+            'skills': [skill.strip().lower() for skill in profile.get('skills', [])],
+            'interests': [interest.strip().lower() for interest in profile.get('interests', [])]
+        }
+        payload = json.dumps(normalized, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+    
     @staticmethod
     def validate_profile(profile: Dict) -> tuple:
         """Validate profile data"""
@@ -0,0 +1,96 @@
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from services.result_cache import ResultCache, normalize_query
+
+
+class QueryPlanner:
+    """Picks and orders search queries by how many unseen issues they yielded before.
+
+    Each query keeps two counters: result slots requested (``capacity``)
+    and new, unique Hacktoberfest issues those slots produced (``unique``).
+    Its yield rate is smoothed towards ``PRIOR_RATE``, so untried queries
+    still get a fair chance and one bad page doesn't bury a query.
+    """
+
+    PRIOR_RATE = 0.5
+    PRIOR_WEIGHT = 20  # Result slots the prior counts as
+
+    def __init__(self, cache: ResultCache = None):
+        self.cache = cache or ResultCache(ttl=7 * 24 * 3600, max_bytes=4 * 1024 * 1024, table='query_stats')
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return f"plan:{normalize_query(query)}"
+
+    def yield_rate(self, query: str) -> float:
+        """Expected share of a result page that is new, relevant issues"""
+
+        stats = self.cache.get(self._key(query)) or {}
+        return ((stats.get('unique', 0) + self.PRIOR_RATE * self.PRIOR_WEIGHT) /
+                (stats.get('capacity', 0) + self.PRIOR_WEIGHT))
+
+    def rank(self, queries: Sequence[str]) -> List[str]:
+        """Queries best-yield first; equal estimates keep their building order"""
+
+        rates = {query: self.yield_rate(query) for query in queries}
+        return sorted(dict.fromkeys(queries), key=lambda query: -rates[query])
+
+    def plan(self, queries: Sequence[str], max_results: int, page_size: Callable[[int], int],
+             max_queries: int = 4,
+             cached: Optional[Callable[[str, int], bool]] = None) -> Tuple[List[str], List[str], int]:
+        """(queries to run now, ranked spares, page size) for a search.
+
+        Among the query counts whose best-ranked queries are expected to
+        yield ``max_results`` at the resulting page size (or the most
+        allowed), picks the one needing the fewest API calls, then the
+        fewest queries. ``cached(query, per_page)`` marks queries answerable
+        without a call; they rank first and fill any slots left over.
+        """
+
+        ranked = self.rank(queries)
+        if not ranked:
+            return [], [], page_size(1)
+
+        rates = {query: self.yield_rate(query) for query in ranked}
+        most = min(max_queries, len(ranked))
+        best = None
+        for count in range(1, most + 1):
+            per_page = page_size(count)
+            free = set() if cached is None else {query for query in ranked if cached(query, per_page)}
+            order = sorted(ranked, key=lambda query: query not in free)
+            if count < most and sum(rates[query] for query in order[:count]) * per_page < max_results:
+                continue
+            calls = sum(1 for query in order[:count] if query not in free)
+            if best is None or calls < best[0]:
+                best = (calls, count, per_page, order, free)
+
+        _, count, per_page, order, free = best
+        while count < most and order[count] in free:
+            count += 1
+        return order[:count], order[count:], per_page
+
+    def record(self, query: str, capacity: int, unique: int):
+        """Count one fetched page: ``capacity`` slots requested, ``unique`` new issues found"""
+
+        key = self._key(query)
+        with self._lock:
+            stats = self.cache.get(key) or {'capacity': 0, 'unique': 0}
+            self.cache.set(key, {
+                'capacity': stats['capacity'] + capacity,
+                'unique': stats['unique'] + min(unique, capacity)
+            })
+
+    def stats(self, query: str) -> Dict:
+        return dict(self.cache.get(self._key(query)) or {'capacity': 0, 'unique': 0},
+                    rate=self.yield_rate(query))
+
+
+# Hit statistics shared by every session, on disk when ISSUE_CACHE_PATH is set
+query_planner = QueryPlanner(ResultCache(
+    ttl=7 * 24 * 3600,
+    max_bytes=4 * 1024 * 1024,
+    path=os.getenv('ISSUE_CACHE_PATH') or None,
+    table='query_stats'
+))
@@ -0,0 +1,218 @@
+import hashlib
+import math
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+# (requests, window in seconds) per GitHub resource before any headers are seen
+AUTHENTICATED_LIMITS = {
+    'core': (5000, 3600),
+    'search': (30, 60),
+    'graphql': (5000, 3600),
+}
+UNAUTHENTICATED_LIMITS = {
+    'core': (60, 3600),
+    'search': (10, 60),
+    'graphql': (0, 3600),  # GraphQL requires a token
+}
+
+
+class TokenBucket:
+    """Fixed-window quota for one (token, resource) pair, corrected by GitHub's headers.
+
+    Like GitHub's own limit, the quota comes back in full when the window
+    resets (at ``X-RateLimit-Reset`` once a response has reported it), not
+    gradually: before then, nothing beyond the reported remaining count is
+    handed out.
+    """
+
+    def __init__(self, capacity: int, window: float):
+        self.capacity = capacity
+        self.window = window
+        self.tokens = float(capacity)
+        self.resets_at = time.monotonic() + window  # monotonic end of the current window
+        self.blocked_until = 0.0  # monotonic time before which nothing may be sent
+        self.reset_at = None  # epoch reset of the server-side window last seen
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        if now >= self.resets_at:
+            # Requests reserved beyond a window are paid from the next ones
+            windows = int((now - self.resets_at) // self.window) + 1
+            self.tokens = min(self.capacity, self.tokens + windows * self.capacity)
+            self.resets_at += windows * self.window
+
+    def _wait(self, now: float, tokens: float) -> float:
+        """Time until ``tokens`` (the count after a reservation) is covered"""
+
+        wait = max(0.0, self.blocked_until - now)
+        if tokens < 0:
+            if self.capacity <= 0:
+                wait = max(wait, self.window)
+            else:
+                # The current window ends first, later ones each cover a full capacity
+                windows = math.ceil(-tokens / self.capacity)
+                wait = max(wait, self.resets_at - now + (windows - 1) * self.window)
+        return wait
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it"""
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            return self._wait(now, self.tokens)
+
+    def reserved_wait(self) -> float:
+        """How long an already reserved request must still wait, after updates from other responses"""
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self._wait(now, self.tokens)
+
+    def refund(self):
+        """Give back a token for a request the server didn't count"""
+
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+    def wait_time(self) -> float:
+        """How long a new request would have to wait, without reserving"""
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self._wait(now, self.tokens - 1)
+
+    def update(self, limit: Optional[int] = None, remaining: Optional[int] = None,
+               reset: Optional[float] = None, retry_after: Optional[float] = None):
+        """Resynchronise with the server's view of the quota"""
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if limit:
+                self.capacity = limit
+
+            if reset:
+                # Convert the epoch reset time to the monotonic clock
+                self.resets_at = now + max(0.0, reset - time.time())
+
+            if remaining is not None:
+                if reset and reset != self.reset_at:
+                    # A new server-side window started, its count is authoritative
+                    self.tokens = float(remaining)
+                    self.reset_at = reset
+                else:
+                    # Requests reserved but not yet answered still count against us
+                    self.tokens = min(self.tokens, float(remaining))
+                if remaining <= 0 and reset:
+                    self.blocked_until = max(self.blocked_until, self.resets_at)
+
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'limit': self.capacity,
+                'remaining': max(0, int(self.tokens)),
+                'resets_in': max(0.0, self.resets_at - now),
+                'blocked_for': max(0.0, self.blocked_until - now)
+            }
+
+
+class RateLimiter:
+    """Process-wide registry of token buckets keyed by token and resource"""
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def token_key(token: Optional[str]) -> str:
+        """Stable, non-reversible key for a token so raw secrets are never stored"""
+
+        if not token:
+            return 'anonymous'
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+
+    def bucket(self, token_key: str, resource: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get((token_key, resource))
+            if bucket is None:
+                defaults = UNAUTHENTICATED_LIMITS if token_key == 'anonymous' else AUTHENTICATED_LIMITS
+                capacity, window = defaults.get(resource, defaults['core'])
+                bucket = TokenBucket(capacity, window)
+                self._buckets[(token_key, resource)] = bucket
+            return bucket
+
+    def acquire(self, token_key: str, resource: str, max_wait: Optional[float] = None) -> bool:
+        """Block until a request may be sent; False if that would exceed max_wait"""
+
+        bucket = self.bucket(token_key, resource)
+        if max_wait is not None and bucket.wait_time() > max_wait:
+            return False
+
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        wait = bucket.reserve()
+        while wait > 0:
+            if deadline is not None and time.monotonic() + wait > deadline:
+                bucket.refund()
+                return False
+            time.sleep(wait)
+            # Responses to other requests may have blocked the bucket or moved its reset meanwhile
+            wait = bucket.reserved_wait()
+        return True
+
+    def refund(self, token_key: str, resource: str):
+        self.bucket(token_key, resource).refund()
+
+    def update_from_headers(self, token_key: str, resource: str, headers: Mapping[str, str]):
+        """Feed X-RateLimit-* and Retry-After headers from any GitHub response"""
+
+        resource = headers.get('X-RateLimit-Resource', resource)
+
+        def header_number(name):
+            try:
+                return float(headers[name])
+            except (KeyError, TypeError, ValueError):
+                return None
+
+        limit = header_number('X-RateLimit-Limit')
+        remaining = header_number('X-RateLimit-Remaining')
+
+        self.bucket(token_key, resource).update(
+            limit=int(limit) if limit is not None else None,
+            remaining=int(remaining) if remaining is not None else None,
+            reset=header_number('X-RateLimit-Reset'),
+            retry_after=header_number('Retry-After')
+        )
+
+    def update_from_rate_limit(self, token_key: str, resources: Dict):
+        """Seed buckets from the body of GET /rate_limit"""
+
+        for resource, info in resources.items():
+            self.bucket(token_key, resource).update(
+                limit=info.get('limit'),
+                remaining=info.get('remaining'),
+                reset=info.get('reset')
+            )
+
+    def wait_time(self, token_key: str, resource: str) -> float:
+        return self.bucket(token_key, resource).wait_time()
+
+    def status(self, token_key: str) -> Dict[str, Dict]:
+        with self._lock:
+            buckets = [(resource, bucket) for (key, resource), bucket in self._buckets.items()
+                       if key == token_key]
+        return {resource: bucket.snapshot() for resource, bucket in buckets}
+
+
+# Shared by every GitHubService in the process (i.e. across Streamlit sessions)
+rate_limiter = RateLimiter()
@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+from services.result_cache import ResultCache
+
+# Metadata fields copied onto an issue's 'repository' dict
+METADATA_FIELDS = ('stars', 'language', 'topics', 'archived')
+
+# Fetches metadata for many repositories at once: full_names -> {full_name: metadata}
+MetadataFetcher = Callable[[List[str]], Dict[str, Dict]]
+
+
+class RepoMetadataStore:
+    """Shared stars/language/topics/archived store keyed by repository full_name.
+
+    Entries older than ``ttl`` are still served but refreshed in a background
+    thread; entries are dropped entirely after ``max_age``.
+    """
+
+    def __init__(self, ttl: float = 6 * 3600, max_age: float = 48 * 3600,
+                 cache: Optional[ResultCache] = None):
+        self.ttl = ttl
+        self.cache = cache or ResultCache(ttl=max_age, max_bytes=16 * 1024 * 1024, table='repositories')
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(full_name: str) -> str:
+        return f"repo:{full_name.lower()}"
+
+    def get(self, full_name: str) -> Optional[Dict]:
+        return self.cache.get(self._key(full_name))
+
+    def put(self, full_name: str, metadata: Dict):
+        entry = {field: metadata[field] for field in METADATA_FIELDS if field in metadata}
+        entry['fetched_at'] = time.time()
+        self.cache.set(self._key(full_name), entry)
+
+    def remember(self, issues: Iterable[Dict]):
+        """Record metadata that already came with issues (e.g. from GraphQL search)"""
+
+        for issue in issues:
+            repo = issue.get('repository', {})
+            if 'topics' in repo and repo.get('full_name'):
+                self.put(repo['full_name'], repo)
+
+    def enrich(self, issues: List[Dict], fetcher: MetadataFetcher, max_fetch: int = 50) -> List[Dict]:
+        """Fill repository metadata on every issue in place.
+
+        Unknown repositories are fetched now in one bulk call (up to
+        ``max_fetch``); stale ones are served as-is and refreshed in the
+        background.
+        """
+
+        names = {issue['repository']['full_name'] for issue in issues
+                 if issue.get('repository', {}).get('full_name')}
+
+        known, missing, stale = {}, [], []
+        now = time.time()
+        for name in names:
+            entry = self.get(name)
+            if entry is None:
+                missing.append(name)
+            else:
+                known[name] = entry
+                if now - entry.get('fetched_at', 0) > self.ttl:
+                    stale.append(name)
+
+        if missing:
+            try:
+                fetched = fetcher(missing[:max_fetch])
+            except Exception:
+                fetched = {}
+            for name, metadata in fetched.items():
+                self.put(name, metadata)
+                known[name] = metadata
+
+        if stale:
+            self._refresh_in_background(stale, fetcher)
+
+        for issue in issues:
+            repo = issue.get('repository', {})
+            metadata = known.get(repo.get('full_name'))
+            if metadata:
+                for field in METADATA_FIELDS:
+                    if metadata.get(field) is not None:
+                        repo[field] = metadata[field]
+
+        return issues
+
+    def _refresh_in_background(self, names: List[str], fetcher: MetadataFetcher):
+        with self._lock:
+            names = [name for name in names if name not in self._refreshing]
+            self._refreshing.update(names)
+        if not names:
+            return
+
+        def refresh():
+            try:
+                for name, metadata in fetcher(names).items():
+                    self.put(name, metadata)
+            except Exception:
+                pass  # Keep serving the stale entry, the next enrich retries
+            finally:
+                with self._lock:
+                    self._refreshing.difference_update(names)
+
+        threading.Thread(target=refresh, name='repo-metadata-refresh', daemon=True).start()
+
+
+# Shared by every GitHubService in the process
+repo_metadata = RepoMetadataStore(
+    cache=ResultCache(
+        ttl=48 * 3600,
+        max_bytes=16 * 1024 * 1024,
+        path=os.getenv('ISSUE_CACHE_PATH') or None,
+        table='repositories'
+    )
+)
@@ -0,0 +1,228 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+_QUERY_TOKEN = re.compile(r'\S+?:"[^"]*"|\S+')
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a search query so equivalent queries share a cache key"""
+
+    tokens = _QUERY_TOKEN.findall(query.strip())
+    return ' '.join(sorted(token.lower() for token in tokens))
+
+
+class ResultCache:
+    """Process-wide TTL cache with LRU eviction by byte size.
+
+    Values must be JSON-serialisable. With a ``path`` the cache is backed by
+    SQLite so every worker process (and restarts) share the same entries.
+    """
+
+    # Seconds between recorded accesses of an SQLite entry: LRU order this
+    # coarse is enough, and most hits then need no write
+    ACCESS_RESOLUTION = 60
+
+    def __init__(self, ttl: float = 600, max_bytes: int = 64 * 1024 * 1024,
+                 path: Optional[str] = None, table: str = 'cache'):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.path = path
+        self.table = table
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (value, expires, size)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                f'CREATE TABLE IF NOT EXISTS {table} ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL, '
+                'size INTEGER NOT NULL, accessed REAL NOT NULL)'
+            )
+            self._db.execute(f'CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed)')
+            # Running byte total, kept in step by triggers whichever process writes
+            self._db.execute(
+                f'CREATE TABLE IF NOT EXISTS {table}_size ('
+                'id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL)'
+            )
+            self._db.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {table}_size_insert AFTER INSERT ON {table} '
+                f'BEGIN UPDATE {table}_size SET total = total + new.size; END'
+            )
+            self._db.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {table}_size_update AFTER UPDATE OF size ON {table} '
+                f'BEGIN UPDATE {table}_size SET total = total + new.size - old.size; END'
+            )
+            self._db.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {table}_size_delete AFTER DELETE ON {table} '
+                f'BEGIN UPDATE {table}_size SET total = total - old.size; END'
+            )
+            self._db.execute(
+                f'INSERT OR IGNORE INTO {table}_size (id, total) SELECT 0, COALESCE(SUM(size), 0) FROM {table}'
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh value or None"""
+
+        now = time.time()
+        with self._lock:
+            if self._db is not None:
+                value = self._db_get(key, now)
+            else:
+                value = self._memory_get(key, now)
+
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        encoded = json.dumps(value, separators=(',', ':'))
+        size = len(encoded.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if self._db is not None:
+                self._db_set(key, encoded, expires, size)
+            else:
+                self._memory_set(key, value, expires, size)
+
+    def expires_in(self, key: str) -> Optional[float]:
+        """Seconds until an entry goes stale, None if absent (doesn't count as a lookup)"""
+
+        now = time.time()
+        with self._lock:
+            if self._db is not None:
+                row = self._db.execute(f'SELECT expires FROM {self.table} WHERE key = ?', (key,)).fetchone()
+                expires = row[0] if row else None
+            else:
+                entry = self._entries.get(key)
+                expires = entry[1] if entry else None
+        if expires is None or expires <= now:
+            return None
+        return expires - now
+
+    def delete(self, key: str):
+        with self._lock:
+            if self._db is not None:
+                self._db.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+                self._db.commit()
+            elif key in self._entries:
+                self._size -= self._entries.pop(key)[2]
+
+    def clear(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.execute(f'DELETE FROM {self.table}')
+                self._db.commit()
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            if self._db is not None:
+                entries = self._db.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+                size = self._db_size()
+            else:
+                entries, size = len(self._entries), self._size
+            lookups = self.hits + self.misses
+            return {
+                'entries': entries,
+                'bytes': size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
+
+    # In-memory tier (callers hold self._lock)
+
+    def _memory_get(self, key: str, now: float) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires, size = entry
+        if expires <= now:
+            del self._entries[key]
+            self._size -= size
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _memory_set(self, key: str, value: Any, expires: float, size: int):
+        if key in self._entries:
+            self._size -= self._entries.pop(key)[2]
+        self._entries[key] = (value, expires, size)
+        self._size += size
+
+        while self._size > self.max_bytes and self._entries:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+            self.evictions += 1
+
+    # SQLite tier (callers hold self._lock)
+
+    def _db_get(self, key: str, now: float) -> Optional[Any]:
+        row = self._db.execute(f'SELECT value, expires, accessed FROM {self.table} WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] <= now:
+            self._db.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+            self._db.commit()
+            return None
+        if now - row[2] >= self.ACCESS_RESOLUTION:
+            self._db.execute(f'UPDATE {self.table} SET accessed = ? WHERE key = ?', (now, key))
+            self._db.commit()
+        return json.loads(row[0])
+
+    def _db_size(self) -> int:
+        return self._db.execute(f'SELECT total FROM {self.table}_size').fetchone()[0]
+
+    def _db_set(self, key: str, encoded: str, expires: float, size: int):
+        now = time.time()
+        # An upsert rather than INSERT OR REPLACE, so the size triggers see the old row
+        self._db.execute(
+            f'INSERT INTO {self.table} (key, value, expires, size, accessed) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires = excluded.expires, '
+            'size = excluded.size, accessed = excluded.accessed',
+            (key, encoded, expires, size, now)
+        )
+
+        total = self._db_size()
+        if total > self.max_bytes:
+            # Drop expired rows first, then least recently used until under budget
+            self._db.execute(f'DELETE FROM {self.table} WHERE expires <= ?', (now,))
+            total = self._db_size()
+            rows = self._db.execute(f'SELECT key, size FROM {self.table} ORDER BY accessed').fetchall()
+            for evicted_key, evicted_size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._db.execute(f'DELETE FROM {self.table} WHERE key = ?', (evicted_key,))
+                total -= evicted_size
+                self.evictions += 1
+        self._db.commit()
+
+
+# Formatted GitHub search results shared by every session in the process
+issue_cache = ResultCache(
+    ttl=float(os.getenv('ISSUE_CACHE_TTL', '600')),
+    max_bytes=int(os.getenv('ISSUE_CACHE_MAX_BYTES', str(64 * 1024 * 1024))),
+    path=os.getenv('ISSUE_CACHE_PATH') or None,
+    table='issues'
+)
@@ -0,0 +1,126 @@
+import base64
+import os
+from typing import Dict, List, Optional
+import ollama
+import streamlit as st
+from services.analysis_cache import issue_fingerprint, profile_key
+from services.result_cache import ResultCache
+
+try:
+    import numpy as np
+    NUMPY_SUPPORT = True
+except ImportError:
+    NUMPY_SUPPORT = False
+
+# Local Ollama embedding model (ollama pull nomic-embed-text)
+EMBEDDING_MODEL = os.getenv('OLLAMA_EMBED_MODEL', 'nomic-embed-text')
+
+
+def issue_text(issue: Dict) -> str:
+    """What an issue is about, for embedding: title, labels, repository and the start of the body"""
+
+    repo = issue.get('repository') or {}
+    parts = [
+        issue.get('title', ''),
+        ', '.join(issue.get('labels') or []),
+        ' '.join([repo.get('language') or '', *(repo.get('topics') or [])]),
+        (issue.get('body') or '')[:500]
+    ]
+    return '\n'.join(part for part in parts if part.strip())
+
+
+def profile_text(profile: Dict) -> str:
+    return (f"{profile.get('experience_level', '')} developer. "
+            f"Skills: {', '.join(profile.get('skills', [])[:10])}. "
+            f"Interests: {', '.join(profile.get('interests', [])[:8])}.")
+
+
+class SemanticMatcher:
+    """Ranks issues by embedding similarity to a profile, as a cheap pass before the LLM.
+
+    Issue embeddings are cached by issue content (edits miss), so after the
+    first search ranking hundreds of candidates is one matrix product.
+    ``rank`` returns None when numpy or the embedding model is unavailable;
+    callers then keep their own order.
+    """
+
+    def __init__(self, client: Optional[ollama.Client] = None, model: str = EMBEDDING_MODEL,
+                 cache: Optional[ResultCache] = None):
+        self.client = client or ollama.Client(timeout=10)
+        self.model = model
+        self.cache = cache or ResultCache(ttl=30 * 24 * 3600, max_bytes=32 * 1024 * 1024, table='embeddings')
+
+    @property
+    def available(self) -> bool:
+        return NUMPY_SUPPORT
+
+    def rank(self, issues: List[Dict], profile: Dict, cached_only: bool = False) -> Optional[List[Dict]]:
+        """The issues most similar to the profile first, None if embeddings are unavailable.
+
+        With ``cached_only`` nothing is embedded, so it never waits on the
+        model: issues without a cached embedding go last, and it returns
+        None if the profile has none yet.
+        """
+
+        if not self.available or not issues:
+            return None
+        keys = [issue_fingerprint(issue) for issue in issues] + [f"profile:{profile_key(profile)}"]
+        if cached_only:
+            vectors = self._cached(keys)
+        else:
+            try:
+                # The profile and every uncached issue go out in one request
+                vectors = self._embed_cached(keys, [issue_text(issue) for issue in issues] + [profile_text(profile)])
+            except Exception as e:
+                st.warning(f"⚠️ Semantic ranking unavailable: {e}")
+                return None
+
+        target = vectors.pop()
+        if target is None:
+            return None
+        known = [index for index, vector in enumerate(vectors) if vector is not None]
+        # Cosine similarity is at least -1, so issues without an embedding rank last
+        similarity = np.full(len(issues), -2.0, dtype=np.float32)
+        if known:
+            similarity[known] = np.vstack([vectors[index] for index in known]) @ target
+        order = np.argsort(-similarity, kind='stable')
+        return [issues[index] for index in order]
+
+    def embed_issues(self, issues: List[Dict]) -> 'np.ndarray':
+        """Unit-length embeddings, one row per issue"""
+
+        return np.vstack(self._embed_cached([issue_fingerprint(issue) for issue in issues],
+                                            [issue_text(issue) for issue in issues]))
+
+    def _cached(self, keys: List[str]) -> List[Optional['np.ndarray']]:
+        return [self._decode(self.cache.get(f"embedding:{self.model}:{key}")) for key in keys]
+
+    def _embed_cached(self, keys: List[str], texts: List[str]) -> List['np.ndarray']:
+        vectors = self._cached(keys)
+
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
+        if missing:
+            # One request embeds every uncached text
+            response = self.client.embed(model=self.model, input=[texts[index] for index in missing])
+            for index, embedding in zip(missing, response['embeddings']):
+                vector = np.asarray(embedding, dtype=np.float32)
+                vector /= np.linalg.norm(vector) or 1.0
+                vectors[index] = vector
+                self.cache.set(f"embedding:{self.model}:{keys[index]}", base64.b64encode(vector.tobytes()).decode('ascii'))
+
+        return vectors
+
+    @staticmethod
+    def _decode(encoded: Optional[str]) -> Optional['np.ndarray']:
+        if encoded is None:
+            return None
+        return np.frombuffer(base64.b64decode(encoded), dtype=np.float32)
+
+
+# Shared by every session, on disk when ISSUE_CACHE_PATH is set
+semantic_matcher = SemanticMatcher(cache=ResultCache(
+    ttl=30 * 24 * 3600,
+    max_bytes=int(os.getenv('EMBEDDING_CACHE_MAX_BYTES', str(32 * 1024 * 1024))),
+    path=os.getenv('ISSUE_CACHE_PATH') or None,
+    table='embeddings'
+))
@@ -0,0 +1,78 @@
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+from services.rate_limiter import RateLimiter, rate_limiter as shared_rate_limiter
+
+
+class TokenPool:
+    """GitHub tokens shared by a service; every request goes to the least-loaded one.
+
+    Load comes from each token's rate limiter bucket, which follows the
+    X-RateLimit-* headers: the token that could send soonest wins, ties go
+    to the one with the most quota left. An exhausted token's bucket is
+    blocked until its reset, which sidelines it until then.
+    """
+
+    def __init__(self, tokens: Sequence[Optional[str]], rate_limiter: Optional[RateLimiter] = None):
+        unique = list(dict.fromkeys(token for token in tokens if token))
+        # No token at all means anonymous requests
+        self.tokens: List[Tuple[Optional[str], str]] = [
+            (token, RateLimiter.token_key(token)) for token in unique or [None]
+        ]
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def authenticated(self) -> bool:
+        return self.tokens[0][0] is not None
+
+    @property
+    def keys(self) -> List[str]:
+        return [key for _, key in self.tokens]
+
+    def choose(self, resource: str) -> Tuple[Optional[str], str]:
+        """(token, token_key) that should send the next request for a resource"""
+
+        if len(self.tokens) == 1:
+            return self.tokens[0]
+
+        best, best_rank = None, None
+        for token, key in self.tokens:
+            bucket = self.rate_limiter.bucket(key, resource)
+            rank = (bucket.wait_time(), -bucket.snapshot()['remaining'])
+            if best_rank is None or rank < best_rank:
+                best, best_rank = (token, key), rank
+        return best
+
+    def acquire(self, resource: str, max_wait: Optional[float] = None) -> Optional[Tuple[Optional[str], str]]:
+        """Reserve a request on the least-loaded token; None if none frees up within max_wait"""
+
+        token, key = self.choose(resource)
+        if not self.rate_limiter.acquire(key, resource, max_wait=max_wait):
+            return None
+        return token, key
+
+    def wait_time(self, resource: str) -> float:
+        """How long until any token could send a request"""
+
+        return min(self.rate_limiter.wait_time(key, resource) for key in self.keys)
+
+    def snapshot(self, resource: str) -> Dict:
+        """Quota across all tokens: remaining, limit, time to the first window reset and shortest wait"""
+
+        buckets = [self.rate_limiter.bucket(key, resource) for key in self.keys]
+        snapshots = [bucket.snapshot() for bucket in buckets]
+        return {
+            'tokens': len(buckets),
+            'remaining': sum(snapshot['remaining'] for snapshot in snapshots),
+            'limit': sum(snapshot['limit'] for snapshot in snapshots),
+            'resets_in': min(snapshot['resets_in'] for snapshot in snapshots),
+            'wait': self.wait_time(resource)
+        }
+
+
+def service_tokens() -> List[str]:
+    """Service tokens from GITHUB_TOKENS (comma-separated) for users who bring none"""
+
+    return [token.strip() for token in os.getenv('GITHUB_TOKENS', '').split(',') if token.strip()]
@@ -21,6 +21,27 @@ if 'issues' not in st.session_state:
 if 'github_token' not in st.session_state:
     st.session_state.github_token = os.getenv('GITHUB_TOKEN', '')
 
+@st.cache_resource
+def start_issue_prefetch():
+    """Start one background issue prefetch thread per server process"""
+    from services.prefetch_worker import PrefetchWorker
+    return PrefetchWorker().start()
+
+# Opt-in: keeps popular searches warm so they are served from cache
+if os.getenv('PREFETCH_ISSUES') == '1':
+    start_issue_prefetch()
+
+@st.cache_resource
+def load_issue_snapshot(path):
+    """Load a crawler snapshot into the local issue index once per server process"""
+    from services.crawler import load_snapshot
+    from services.issue_index import issue_index
+    return issue_index.add(load_snapshot(path))
+
+# Seeds index searches (ISSUE_SEARCH_MODE=index) from `python -m services.crawler`
+if os.getenv('ISSUE_SNAPSHOT_PATH') and os.path.exists(os.getenv('ISSUE_SNAPSHOT_PATH')):
+    load_issue_snapshot(os.getenv('ISSUE_SNAPSHOT_PATH'))
+
 # Sidebar Navigation
 with st.sidebar:
     st.markdown("## 🎃 Navigation")
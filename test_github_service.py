@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Test script for GitHubService against the local fake GitHub API
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from benchmarks.fake_github_server import FakeGitHub, load_fixtures, start_server
+from services.crawler import IssueCrawler, load_snapshot
+from services.github_service import GitHubService
+from services.http_cache import HTTPCache
+from services.http_session import get_session
+from services.issue_index import IssueIndex, crawl
+from services.issue_snapshot import IssueSnapshot, write_snapshot
+from services.issue_store import IssueStore
+from services.rate_limiter import RateLimiter
+from services.repo_metadata import RepoMetadataStore
+from services.prefetch_worker import DEFAULT_MAX_RESULTS, PrefetchWorker
+from services.query_planner import QueryPlanner
+from services.result_cache import ResultCache
+from services.token_pool import TokenPool
+
+def make_service(base_url, token=None):
+    """GitHubService with private caches so tests don't share state"""
+    return GitHubService(
+        token=token,
+        base_url=base_url,
+        rate_limiter=RateLimiter(),
+        http_cache=HTTPCache(),
+        issue_cache=ResultCache(),
+        repo_metadata=RepoMetadataStore(cache=ResultCache()),
+        issue_store=IssueStore(cache=ResultCache(ttl=3600)),
+        issue_index=IssueIndex(),
+        query_planner=QueryPlanner(ResultCache())
+    )
+
+def test_github_service():
+    """Test fetch_issues end to end on the REST and GraphQL backends"""
+    print("Testing GitHubService...")
+    
+    api = FakeGitHub(load_fixtures(), latency=0.0, jitter=0.0, search_limit=1000)
+    server = start_server(api)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    
+    try:
+        for token in (None, 'test-token'):
+            service = make_service(base_url, token)
+            print(f"🔄 Fetching issues via {service.backend}...")
+            
+            queries = service._candidate_queries(['Python', 'JavaScript'], ['web'], 'beginner')
+            assert all('is:public' in query for query in queries), "shared searches may include private issues"
+            issues = service.fetch_issues(['Python', 'JavaScript'], ['web'], 'beginner', max_results=30)
+            assert len(issues) == 30, f"expected 30 issues, got {len(issues)}"
+            assert len({issue['url'] for issue in issues}) == len(issues), "duplicate issues returned"
+            assert any(issue['repository']['stars'] > 0 for issue in issues), "repository metadata missing"
+            print(f"✅ {service.backend}: {len(issues)} issues, top: {issues[0]['title']}")
+            
+            if service.backend == 'rest':
+                # Anonymous repository lookups stop before they eat the core quota searches need
+                names = [f"octo/repo{n}" for n in range(5)]
+                service.rate_limiter.bucket('anonymous', 'core').update(remaining=service.REST_REPO_LOOKUP_RESERVE)
+                core = api.charged['core']
+                assert service.fetch_repository_metadata(names) == {} and api.charged['core'] == core, "low quota ignored"
+                print("✅ REST repository lookups skipped on low core quota")
+            
+            # A repeat search must be answered from the shared caches
+            searches = api.charged['search'] + api.charged['graphql']
+            again = service.fetch_issues(['Python', 'JavaScript'], ['web'], 'beginner', max_results=30)
+            assert len(again) == len(issues), "cached results differ"
+            # Synced issues arrive in one batch, so ties may rank differently than on the first search
+            third = service.fetch_issues(['Python', 'JavaScript'], ['web'], 'beginner', max_results=30)
+            assert [i['url'] for i in third] == [i['url'] for i in again], "cached results differ"
+            assert api.charged['search'] + api.charged['graphql'] == searches, "repeat search went upstream"
+            print("✅ Repeat search served from cache")
+            
+            # A refresh only downloads what changed, and drops closed or assigned issues
+            closed, assigned, edited = again[0]['url'], again[1]['url'], again[2]['url']
+            api.update_issue(closed, state='closed')
+            api.update_issue(assigned, assignee={'login': 'someone'})
+            api.update_issue(edited, title='Edited title')
+            sent = api.bytes_sent
+            synced = service.fetch_issues(['Python', 'JavaScript'], ['web'], 'beginner', max_results=30, refresh=True)
+            urls = {issue['url'] for issue in synced}
+            assert closed not in urls and assigned not in urls, "closed/assigned issues kept"
+            assert any(i['url'] == edited and i['title'] == 'Edited title' for i in synced), "edit not merged"
+            print(f"✅ Delta sync: {len(synced)} issues, {api.bytes_sent - sent} bytes transferred")
+            for url in (closed, assigned):
+                api.update_issue(url, state='open', assignee=None)
+        
+        print("✅ All tests passed!")
+    finally:
+        server.shutdown()
+
+def test_issue_index():
+    """Test crawling into the local index and answering searches from it"""
+    print("Testing IssueIndex...")
+    
+    api = FakeGitHub(load_fixtures(), latency=0.0, jitter=0.0, search_limit=1000)
+    server = start_server(api)
+    service = make_service(f"http://127.0.0.1:{server.server_address[1]}", 'test-token')
+    
+    try:
+        queries = service._build_hacktoberfest_queries(['Python'], ['web'], 'beginner')
+        stats = crawl(service.issue_index, service, queries)
+        assert stats['issues'] > 0 and service.issue_index.count() > 0, "nothing indexed"
+        print(f"✅ Indexed {service.issue_index.count()} issues")
+        
+        requests_before = sum(api.charged.values())
+        issues = service.fetch_issues(['Python'], ['documentation'], 'beginner', max_results=20, mode='index')
+        assert issues, "index search returned nothing"
+        assert sum(api.charged.values()) == requests_before, "index search went upstream"
+        assert all(issue['difficulty'] == 'easy' for issue in issues), "difficulty filter ignored"
+        print(f"✅ Index search: {len(issues)} issues, top: {issues[0]['title']}")
+        
+        # A closed issue disappears on the next crawl
+        api.update_issue(issues[0]['url'], state='closed')
+        crawl(service.issue_index, service, queries)
+        again = service.fetch_issues(['Python'], ['documentation'], 'beginner', max_results=20, mode='index')
+        assert issues[0]['url'] not in {issue['url'] for issue in again}, "closed issue still indexed"
+        print("✅ Re-crawl removed the closed issue")
+        
+        # A crawl whose searches fail must not prune what it could not see
+        count = service.issue_index.count()
+        api.error_422 = 1.0
+        rest = make_service(f"http://127.0.0.1:{server.server_address[1]}", 'test-token')
+        rest.backend = 'rest'
+        stats = crawl(service.issue_index, rest, queries, max_retries=0, retry_delay=0)
+        api.error_422 = 0.0
+        assert stats['failed'] > 0 and stats['pruned'] == 0, "failed crawl pruned the index"
+        assert service.issue_index.count() == count, "failed crawl changed the index"
+        print(f"✅ Failed re-crawl ({stats['failed']} queries) left {count} issues in place")
+        
+        print("✅ All tests passed!")
+    finally:
+        server.shutdown()
+
+def test_crawler():
+    """Test an interrupted bulk crawl resuming from its checkpoint"""
+    print("Testing IssueCrawler...")
+    
+    api = FakeGitHub(load_fixtures(), latency=0.0, jitter=0.0, search_limit=1000)
+    server = start_server(api)
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            snapshot = os.path.join(tmp, 'issues.jsonl.gz')
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            
+            crawler = IssueCrawler(make_service(base_url, 'test-token'), snapshot, per_page=50, quota_reserve=0)
+            stats = crawler.run(max_rounds=3)
+            assert stats['remaining'] > 0 and not os.path.exists(snapshot), "crawl should be unfinished"
+            print(f"⏸️ Interrupted after {stats['rounds']} rounds, {stats['issues']} issues")
+            
+            # A new process picks up the checkpoint instead of starting over
+            resumed = IssueCrawler(make_service(base_url, 'test-token'), snapshot, per_page=50, quota_reserve=0)
+            stats = resumed.run()
+            issues = list(load_snapshot(snapshot))
+            assert stats['remaining'] == 0 and len(issues) == stats['issues'], "snapshot incomplete"
+            assert len({issue['url'] for issue in issues}) == len(issues), "duplicate issues in snapshot"
+            assert not os.path.exists(resumed.checkpoint_path), "checkpoint left behind"
+            print(f"✅ Resumed crawl: {len(issues)} issues from {stats['queries']} queries")
+    finally:
+        server.shutdown()
+    
+    # Failed pages are retried instead of ending their query early
+    flaky = FakeGitHub(load_fixtures(), latency=0.0, jitter=0.0, search_limit=1000, error_422=0.3)
+    server = start_server(flaky)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            snapshot = os.path.join(tmp, 'issues.jsonl.gz')
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            
+            crawler = IssueCrawler(make_service(base_url), snapshot, per_page=50, quota_reserve=0,
+                                   max_retries=0, retry_delay=0)
+            stats = crawler.run()
+            assert stats['failed'] > 0 and stats['remaining'] > 0, "failed queries counted as done"
+            assert not os.path.exists(snapshot), "snapshot finished despite failed queries"
+            
+            crawler = IssueCrawler(make_service(base_url), snapshot, per_page=50, quota_reserve=0,
+                                   max_retries=10, retry_delay=0)
+            stats = crawler.run()
+            issues = list(load_snapshot(snapshot))
+            assert stats['remaining'] == 0 and len(issues) == len(load_fixtures()['items']), \
+                f"flaky crawl lost issues: {len(issues)}"
+            print(f"✅ Crawl with 30% failing searches retried to all {len(issues)} issues")
+        
+        print("✅ All tests passed!")
+    finally:
+        server.shutdown()
+
+def test_prefetch_worker():
+    """Test that prefetched pages serve the page's default search without going upstream"""
+    print("Testing PrefetchWorker...")
+    
+    api = FakeGitHub(load_fixtures(), latency=0.0, jitter=0.0, search_limit=1000)
+    server = start_server(api)
+    service = make_service(f"http://127.0.0.1:{server.server_address[1]}")
+    
+    try:
+        worker = PrefetchWorker(service, languages=['Python'], quota_reserve=0)
+        stats = worker.run_once()
+        assert stats['refreshed'] and not stats['skipped_for_quota'], f"nothing warmed: {stats}"
+        
+        searches = api.charged['search']
+        issues = service.fetch_issues(['Python'], [], 'beginner', max_results=DEFAULT_MAX_RESULTS[0], keep_fetched=True)
+        assert api.charged['search'] == searches, "warmed search went upstream"
+        assert len(issues) > DEFAULT_MAX_RESULTS[0], "fetched pool was cut to max_results"
+        print(f"✅ Warmed {stats['refreshed']} queries at {worker.page_sizes}, search served {len(issues)} candidates from them")
+        
+        print("✅ All tests passed!")
+    finally:
+        server.shutdown()
+
+def test_issue_snapshot():
+    """Test the memory-mapped binary snapshot and the fallback issues it serves"""
+    print("Testing IssueSnapshot...")
+    
+    formatter = GitHubService(token=None, base_url='http://127.0.0.1:9')
+    issues = [formatter._format_issue(item) for item in load_fixtures()['items']]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'issues.bin')
+        assert write_snapshot(path, issues) == len(issues)
+        snapshot = IssueSnapshot(path)
+        
+        try:
+            assert len(snapshot) == len(issues), "record count mismatch"
+            first = snapshot.issue(0)
+            for field in ('id', 'title', 'body', 'url', 'difficulty', 'updated_epoch', 'hacktoberfest_score'):
+                assert first[field] == issues[0][field], f"{field} did not round-trip"
+            assert list(first['labels']) == issues[0]['labels'], "labels did not round-trip"
+            
+            easy_python = snapshot.top(5, difficulties=['easy'], languages=['python'])
+            assert easy_python and all(i['difficulty'] == 'easy' for i in easy_python), "difficulty filter ignored"
+            print(f"✅ {len(snapshot)} issues mapped, {os.path.getsize(path)} bytes, top: {snapshot.top(1)[0]['title']}")
+            
+            service = GitHubService(token=None, base_url='http://127.0.0.1:9', issue_snapshot=snapshot)
+            fallback = service._get_hacktoberfest_fallback_issues(['Rust'], 'beginner', 5)
+            assert len(fallback) == 5 and fallback[0]['url'].startswith('https://github.com/'), "snapshot fallback unused"
+            print(f"✅ Fallback served {len(fallback)} snapshot issues")
+        finally:
+            snapshot.close()
+    
+    print("✅ All tests passed!")
+
+def test_result_cache():
+    """Test the SQLite cache's running size total, eviction and throttled access writes"""
+    print("Testing ResultCache...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.db')
+        cache = ResultCache(max_bytes=1000, path=path)
+        for n in range(20):
+            cache.set(f'key{n}', 'x' * 100)
+        cache.set('key19', 'y' * 50)
+        cache.delete('key18')
+        
+        summed = cache._db.execute('SELECT SUM(size) FROM cache').fetchone()[0]
+        stats = cache.stats()
+        assert stats['bytes'] == summed <= 1000, f"running total {stats['bytes']} != {summed}"
+        assert stats['evictions'] > 0 and cache.get('key0') is None, "nothing evicted"
+        
+        # A second process sees the same total
+        assert ResultCache(max_bytes=1000, path=path).stats()['bytes'] == summed, "total not shared"
+        print(f"✅ {stats['entries']} entries, {stats['bytes']} bytes tracked without a full scan")
+        
+        accessed = lambda: cache._db.execute("SELECT accessed FROM cache WHERE key = 'key19'").fetchone()[0]
+        before = accessed()
+        assert cache.get('key19') == 'y' * 50 and accessed() == before, "recent hit rewrote accessed"
+        cache._db.execute("UPDATE cache SET accessed = accessed - ? WHERE key = 'key19'", (cache.ACCESS_RESOLUTION,))
+        cache.get('key19')
+        assert accessed() > before - cache.ACCESS_RESOLUTION, "stale access time not refreshed"
+        print("✅ Hits only write their access time once it is stale")
+    
+    print("✅ All tests passed!")
+
+def test_token_pool():
+    """Test that requests spread over a token pool and no token is overdrawn"""
+    print("Testing TokenPool...")
+    
+    api = FakeGitHub(load_fixtures(), latency=0.0, jitter=0.0, search_limit=5)
+    server = start_server(api)
+    
+    try:
+        limiter = RateLimiter()
+        pool = TokenPool(['token-a', 'token-b', 'token-c'], limiter)
+        service = GitHubService(base_url=f"http://127.0.0.1:{server.server_address[1]}", backend='rest',
+                                rate_limiter=limiter, token_pool=pool, http_cache=HTTPCache(),
+                                issue_cache=ResultCache())
+        
+        # Three tokens with 5 searches each serve 15 searches without hitting a limit
+        query = 'state:open type:issue label:"hacktoberfest"'
+        for page in range(1, 16):
+            issues, _ = service._search_page(query, per_page=10, page=page % 5 + 1, cache=False)
+            assert issues, f"search {page} was rate limited"
+        
+        used = sorted(window[1] for (token, resource), window in api.windows.items() if resource == 'search')
+        assert used == [5, 5, 5], f"uneven token use: {used}"
+        assert pool.snapshot('search')['remaining'] == 0, "pool should be exhausted"
+        print(f"✅ 15 searches spread over {len(pool)} tokens: {used}")
+        
+        print("✅ All tests passed!")
+    finally:
+        server.shutdown()
+
+def test_rate_limiter():
+    """Test that the limiter holds requests until GitHub's fixed window resets"""
+    print("Testing RateLimiter...")
+    
+    api = FakeGitHub(load_fixtures(), latency=0.0, jitter=0.0, search_limit=10, window=3)
+    server = start_server(api)
+    
+    try:
+        service = make_service(f"http://127.0.0.1:{server.server_address[1]}")
+        query = 'state:open type:issue label:"hacktoberfest"'
+        for page in range(1, 8):
+            service._search_page(query, per_page=10, page=page, cache=False)
+        
+        # The 11th search in a 10-per-window limit must wait for the reset, not trickle in early
+        start = time.perf_counter()
+        results = service._run_queries([(query, page) for page in range(1, 5)], per_page=10, cache=False)
+        elapsed = time.perf_counter() - start
+        assert all(has_next is not None for _, has_next in results), "a search was rate limited"
+        assert elapsed < api.window + 1, f"searches took {elapsed:.1f}s"
+        assert service.rate_limiter.bucket('anonymous', 'search').snapshot()['blocked_for'] == 0, "bucket blocked"
+        print(f"✅ 11 searches in a 10-per-window limit, last one after {elapsed:.1f}s without a 403")
+        
+        # A large search stops paging at the quota instead of queueing behind it
+        api = FakeGitHub(load_fixtures(), latency=0.0, jitter=0.0, search_limit=10)
+        server.shutdown()
+        server = start_server(api)
+        service = make_service(f"http://127.0.0.1:{server.server_address[1]}")
+        start = time.perf_counter()
+        issues = service.fetch_issues(['Python', 'JavaScript'], ['web'], 'beginner', max_results=200)
+        elapsed = time.perf_counter() - start
+        assert issues and service.failed_pages == 0, f"{service.failed_pages} pages failed"
+        assert elapsed < 2, f"search stalled on quota for {elapsed:.1f}s"
+        print(f"✅ {len(issues)} issues from {api.charged['search']} searches in {elapsed:.1f}s on a 10-search quota")
+        
+        # Secondary limits (429 + Retry-After) reach the limiter instead of being retried in the adapter
+        retry = get_session().get_adapter('https://api.github.com').max_retries
+        assert not retry.is_retry('GET', 429, has_retry_after=True), "adapter retries 429s itself"
+        assert not retry.is_retry('GET', 403, has_retry_after=True), "adapter retries 403s itself"
+        
+        print("✅ All tests passed!")
+    finally:
+        server.shutdown()
+
+def test_query_planner():
+    """Test that queries are ranked by past yield and cached queries come first"""
+    print("Testing QueryPlanner...")
+    
+    planner = QueryPlanner(ResultCache())
+    queries = ['label:"good first issue"', 'label:"hacktoberfest" language:python', 'label:"help wanted"']
+    page_size = lambda count: 100 if count == 1 else 50
+    
+    # Untried queries share the prior, so the building order is kept
+    assert planner.rank(queries) == queries, "untried queries reordered"
+    
+    planner.record(queries[0], capacity=100, unique=2)
+    planner.record(queries[2], capacity=100, unique=90)
+    assert planner.rank(queries)[0] == queries[2], "best-yield query not ranked first"
+    
+    chosen, spares, per_page = planner.plan(queries, 40, page_size, max_queries=2)
+    assert chosen == [queries[2]] and per_page == 100, f"expected one high-yield query, got {chosen}"
+    assert spares[-1] == queries[0], "low-yield query should be the last spare"
+    
+    # A cached query costs no request, so it is used even with a lower estimate
+    cached = lambda query, per_page: query == queries[0]
+    chosen, _, per_page = planner.plan(queries, 40, page_size, max_queries=2, cached=cached)
+    assert chosen[0] == queries[0], f"cached query not preferred: {chosen}"
+    print(f"✅ Planned {chosen} at {per_page} per page")
+    
+    print("✅ All tests passed!")
+
+def run_tests(tests):
+    """Run each test, printing failures; exit non-zero if any failed (pytest collects the tests directly)"""
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"❌ Test failed: {str(e)}")
+            failed += 1
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    run_tests([
+        test_github_service,
+        test_issue_index,
+        test_crawler,
+        test_prefetch_worker,
+        test_issue_snapshot,
+        test_result_cache,
+        test_token_pool,
+        test_rate_limiter,
+        test_query_planner
+    ])